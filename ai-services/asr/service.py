@@ -20,6 +20,8 @@ from ..common.config import ASRConfig
 class ASRRequest(BaseModel):
     """ASR processing request"""
     audio_path: str
+    audio_pcm_offset: Optional[int] = None  # Start of mono s16le samples at sample_rate in audio_path
+    audio_pcm_bytes: Optional[int] = None  # Length of those samples in bytes
     language: Optional[str] = None
     task: str = "transcribe"  # transcribe or translate
     return_segments: bool = True
@@ -81,8 +83,11 @@ class ASRService(BaseAIService):
             task=request.task
         )
         
-        # Load and preprocess audio
-        audio = await self._load_audio(request.audio_path)
+        # Load and preprocess audio, skipping the decode when the caller located the PCM samples
+        if request.audio_pcm_offset is not None and request.audio_pcm_bytes is not None:
+            audio = self._map_pcm(request.audio_path, request.audio_pcm_offset, request.audio_pcm_bytes)
+        else:
+            audio = await self._load_audio(request.audio_path)
         
         # Run Whisper inference
         result = await self._transcribe_audio(
@@ -114,6 +119,17 @@ class ASRService(BaseAIService):
             processing_time=0.0  # Will be set by base service
         )
     
+    def _map_pcm(self, audio_path: str, offset: int, length: int) -> np.ndarray:
+        """Memory-map int16 PCM samples and peak-normalize them into one float32 buffer"""
+        pcm = np.memmap(audio_path, dtype=np.int16, mode="r", offset=offset, shape=(length // 2,))
+        audio = np.zeros(pcm.shape, dtype=np.float32)
+        
+        # Same result as librosa.util.normalize, scaled straight from int16 without temporaries
+        peak = max(int(pcm.max(initial=0)), -int(pcm.min(initial=0)))
+        if peak:
+            np.multiply(pcm, 1.0 / peak, out=audio, dtype=np.float32)
+        return audio
+    
     async def _load_audio(self, audio_path: str) -> np.ndarray:
         """Load and preprocess audio file"""
         try:
@@ -14,6 +14,14 @@ from ..common.base_service import BaseAIService
 from ..common.config import TranslationConfig
 
 
+def _sequence_confidences(generated) -> List[float]:
+    """Confidence per generated row from its beam-search sequence score"""
+    if getattr(generated, "sequences_scores", None) is None:
+        return [0.8] * len(generated.sequences)  # Default confidence
+    # Length-normalized sequence log-probability -> mean token probability
+    return torch.exp(generated.sequences_scores).tolist()
+
+
 class TranslationRequest(BaseModel):
     """Translation request"""
     text: str
@@ -23,6 +31,14 @@ class TranslationRequest(BaseModel):
     max_length: Optional[int] = None
 
 
+class MultiTranslationRequest(BaseModel):
+    """Translation of one text into several target languages"""
+    text: str
+    source_language: str
+    target_languages: List[str]
+    max_length: Optional[int] = None
+
+
 class TranslationResult(BaseModel):
     """Translation result"""
     translated_text: str
@@ -186,13 +202,7 @@ class TranslationService(BaseAIService):
                     skip_special_tokens=True
                 )[0]
                 
-                # Calculate confidence from scores
-                scores = generated_tokens.scores
-                if scores:
-                    avg_score = torch.stack(scores).mean().item()
-                    confidence = torch.sigmoid(torch.tensor(avg_score)).item()
-                else:
-                    confidence = 0.8
+                confidence = _sequence_confidences(generated_tokens)[0]
             
             return translated_text.strip(), confidence
             
@@ -200,6 +210,98 @@ class TranslationService(BaseAIService):
             self.logger.error("Translation failed", error=str(e))
             raise
     
+    async def translate_multi(self, input_data: Dict[str, Any]) -> Dict[str, TranslationResult]:
+        """Translate one text into every requested target language"""
+        request = MultiTranslationRequest(**input_data)
+        
+        self.logger.info(
+            "Processing multi-target translation request",
+            source_lang=request.source_language,
+            target_langs=request.target_languages,
+            text_length=len(request.text)
+        )
+        
+        for lang in [request.source_language, *request.target_languages]:
+            if lang not in self.config.supported_languages:
+                raise ValueError(f"Unsupported language: {lang}")
+        
+        max_length = request.max_length or self.config.max_length
+        
+        if self.pipeline:
+            # The pipeline fixes one target language per call
+            outputs = await asyncio.gather(*[
+                self._translate_text(request.text, request.source_language, lang, max_length=max_length)
+                for lang in request.target_languages
+            ])
+        else:
+            outputs = await self._translate_text_multi(
+                request.text,
+                request.source_language,
+                request.target_languages,
+                max_length=max_length
+            )
+        
+        return {
+            lang: TranslationResult(
+                translated_text=translated_text,
+                source_language=request.source_language,
+                target_language=lang,
+                confidence_score=confidence,
+                processing_time=0.0
+            )
+            for lang, (translated_text, confidence) in zip(request.target_languages, outputs)
+        }
+    
+    async def _translate_text_multi(
+        self,
+        text: str,
+        source_lang: str,
+        target_langs: List[str],
+        max_length: int = 512
+    ) -> List[tuple[str, float]]:
+        """Translate into all targets in one batch, one target-language prefix per row"""
+        def generate():
+            self.tokenizer.src_lang = source_lang
+            
+            inputs = self.tokenizer(
+                [text] * len(target_langs),
+                return_tensors="pt",
+                max_length=max_length,
+                truncation=True,
+                padding=True
+            ).to(self.device)
+            
+            # Per-row forced BOS: decoder start token followed by the target language tag
+            decoder_input_ids = torch.tensor(
+                [
+                    [self.model.config.decoder_start_token_id, self.tokenizer.get_lang_id(lang)]
+                    for lang in target_langs
+                ],
+                device=self.device
+            )
+            
+            with torch.no_grad():
+                generated = self.model.generate(
+                    **inputs,
+                    decoder_input_ids=decoder_input_ids,
+                    max_length=max_length,
+                    num_beams=4,
+                    early_stopping=True,
+                    return_dict_in_generate=True,
+                    output_scores=True
+                )
+            
+            texts = self.tokenizer.batch_decode(generated.sequences, skip_special_tokens=True)
+            confidences = _sequence_confidences(generated)
+            return [(t.strip(), c) for t, c in zip(texts, confidences)]
+        
+        try:
+            loop = asyncio.get_event_loop()
+            return await loop.run_in_executor(None, generate)
+        except Exception as e:
+            self.logger.error("Multi-target translation failed", error=str(e))
+            raise
+    
     async def calculate_bleu_score(
         self,
         translated_text: str,
@@ -253,6 +355,11 @@ class TranslationService(BaseAIService):
             """Translate text"""
             return await self.process(request.dict())
         
+        @app.post("/translate_multi")
+        async def translate_multi(request: MultiTranslationRequest):
+            """Translate text into several target languages at once"""
+            return {"translations": await self.translate_multi(request.dict())}
+        
         @app.post("/batch-translate")
         async def batch_translate_endpoint(
             texts: List[str],
@@ -3,6 +3,7 @@ Text-to-Speech (TTS) Service with Voice Cloning
 """
 
 import asyncio
+import hashlib
 import tempfile
 import os
 from typing import Dict, Any, Optional
@@ -22,6 +23,7 @@ class TTSRequest(BaseModel):
     text: str
     language: str
     speaker_wav: Optional[str] = None  # Path to speaker reference audio
+    speaker_id: Optional[str] = None  # Enrolled speaker, preferred over speaker_wav
     emotion: str = "neutral"
     speed: float = 1.0
     output_path: Optional[str] = None
@@ -34,6 +36,11 @@ class VoiceCloningRequest(BaseModel):
     language: str
 
 
+class SpeakerEnrollmentRequest(BaseModel):
+    """Speaker enrollment request"""
+    reference_audio: str
+
+
 class TTSResult(BaseModel):
     """TTS processing result"""
     audio_path: str
@@ -51,6 +58,7 @@ class TTSService(BaseAIService):
         super().__init__(config)
         self.tts_model = None
         self.voice_cloning_model = None
+        self.enrolled_speakers: Dict[str, str] = {}  # speaker_id -> reference audio path
     
     async def load_model(self):
         """Load TTS models"""
@@ -108,6 +116,7 @@ class TTSService(BaseAIService):
             text=request.text,
             language=request.language,
             speaker_wav=request.speaker_wav,
+            speaker_id=request.speaker_id,
             emotion=request.emotion,
             speed=request.speed,
             output_path=output_path
@@ -126,6 +135,7 @@ class TTSService(BaseAIService):
         text: str,
         language: str,
         speaker_wav: Optional[str] = None,
+        speaker_id: Optional[str] = None,
         emotion: str = "neutral",
         speed: float = 1.0,
         output_path: str = None
@@ -134,7 +144,24 @@ class TTSService(BaseAIService):
         try:
             loop = asyncio.get_event_loop()
             
-            if speaker_wav and os.path.exists(speaker_wav):
+            if speaker_id in self.enrolled_speakers:
+                # Voice cloning with the cached speaker embedding
+                await loop.run_in_executor(
+                    None,
+                    lambda: self.voice_cloning_model.tts_to_file(
+                        text=text,
+                        speaker=speaker_id,
+                        language=language,
+                        file_path=output_path,
+                        speed=speed
+                    )
+                )
+                
+                similarity = await self._calculate_speaker_similarity(
+                    self.enrolled_speakers[speaker_id], output_path
+                )
+                
+            elif speaker_wav and os.path.exists(speaker_wav):
                 # Voice cloning mode
                 await loop.run_in_executor(
                     None,
@@ -234,6 +261,36 @@ class TTSService(BaseAIService):
             self.logger.warning("Failed to get audio duration", error=str(e))
             return 0.0
     
+    async def enroll_speaker(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Compute a speaker embedding once so later syntheses can reuse it"""
+        request = SpeakerEnrollmentRequest(**input_data)
+        
+        if not os.path.exists(request.reference_audio):
+            raise FileNotFoundError(f"Reference audio not found: {request.reference_audio}")
+        
+        # Same clip, same id: re-enrollment of unchanged audio is a cache hit
+        mtime_ns = os.stat(request.reference_audio).st_mtime_ns
+        speaker_id = hashlib.sha256(
+            f"{request.reference_audio}:{mtime_ns}".encode()
+        ).hexdigest()[:16]
+        
+        if speaker_id not in self.enrolled_speakers:
+            self.logger.info("Enrolling speaker", speaker_id=speaker_id)
+            
+            # Register the embedding with the model's speaker manager so it
+            # can be selected by name like a built-in speaker
+            manager = self.voice_cloning_model.synthesizer.tts_model.speaker_manager
+            loop = asyncio.get_event_loop()
+            embedding = await loop.run_in_executor(
+                None,
+                lambda: manager.compute_embedding_from_clip(request.reference_audio)
+            )
+            manager.embeddings[speaker_id] = {"name": speaker_id, "embedding": embedding}
+            manager.embeddings_by_names[speaker_id] = [embedding]
+            self.enrolled_speakers[speaker_id] = request.reference_audio
+        
+        return {"speaker_id": speaker_id}
+    
     async def clone_voice(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
         """Create voice clone from reference audio"""
         request = VoiceCloningRequest(**input_data)
@@ -279,6 +336,11 @@ class TTSService(BaseAIService):
             """Synthesize speech from text"""
             return await self.process(request.dict())
         
+        @app.post("/enroll_speaker")
+        async def enroll_speaker_endpoint(request: SpeakerEnrollmentRequest):
+            """Enroll a speaker once for reuse across languages"""
+            return await self.enroll_speaker(request.dict())
+        
         @app.post("/clone-voice")
         async def clone_voice_endpoint(request: VoiceCloningRequest):
             """Create voice clone from reference audio"""
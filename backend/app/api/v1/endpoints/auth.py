@@ -105,4 +105,4 @@ async def register(
     db.commit()
     db.refresh(user)
     
-    return UserResponse.from_orm(user)
\ No newline at end of file
+    return UserResponse.model_validate(user)
\ No newline at end of file
@@ -2,8 +2,10 @@
 Main dubbing endpoints - the core functionality of the platform
 """
 
+import asyncio
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form, Response
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 import structlog
 
@@ -12,15 +14,19 @@ from app.core.exceptions import *
 from app.models import User, Project, Job, MediaFile
 from app.schemas.dubbing import *
 from app.services.dubbing import DubbingService
+from app.services.progress import get_progress_bus
+from app.worker import process_dubbing_job
 from app.api.deps import get_current_user
 
 logger = structlog.get_logger()
 router = APIRouter()
 
+# Built once; validates and serializes a whole page of jobs in a single call
+_JOB_LIST_ADAPTER = TypeAdapter(List[DubbingJobResponse])
+
 
 @router.post("/process", response_model=DubbingJobResponse)
 async def create_dubbing_job(
-    background_tasks: BackgroundTasks,
     video_file: UploadFile = File(...),
     target_languages: str = Form(...),  # JSON string of language codes
     source_language: Optional[str] = Form(None),
@@ -72,11 +78,8 @@ async def create_dubbing_job(
             request=request
         )
         
-        # Start processing in background
-        background_tasks.add_task(
-            dubbing_service.process_dubbing_job,
-            job.id
-        )
+        # Hand processing to a Celery worker; publishing blocks on the broker
+        await asyncio.to_thread(process_dubbing_job.delay, str(job.id))
         
         logger.info(
             "Dubbing job created",
@@ -85,7 +88,7 @@ async def create_dubbing_job(
             target_languages=target_langs
         )
         
-        return DubbingJobResponse.from_orm(job)
+        return DubbingJobResponse.model_validate(job)
         
     except json.JSONDecodeError:
         raise ValidationError("Invalid target_languages format")
@@ -109,7 +112,7 @@ async def get_dubbing_job(
     if not job:
         raise NotFoundError("Dubbing job")
     
-    return DubbingJobResponse.from_orm(job)
+    return DubbingJobResponse.model_validate(job)
 
 
 @router.get("/jobs/{job_id}/progress", response_model=DubbingProgressResponse)
@@ -162,7 +165,6 @@ async def cancel_dubbing_job(
 @router.post("/jobs/{job_id}/retry")
 async def retry_dubbing_job(
     job_id: str,
-    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -178,17 +180,15 @@ async def retry_dubbing_job(
     if not job.can_retry:
         raise ValidationError("Job cannot be retried")
     
-    dubbing_service = DubbingService(db)
-    
     # Retry the job
     job.retry()
     db.commit()
     
-    # Start processing in background
-    background_tasks.add_task(
-        dubbing_service.process_dubbing_job,
-        job.id
-    )
+    # The failed run's live progress would otherwise show until the new run reports
+    await get_progress_bus().clear(job_id)
+    
+    # Hand processing to a Celery worker; publishing blocks on the broker
+    await asyncio.to_thread(process_dubbing_job.delay, job_id)
     
     logger.info("Dubbing job retried", job_id=job_id, user_id=str(current_user.id))
     
@@ -211,7 +211,10 @@ async def list_dubbing_jobs(
     
     jobs = query.offset(skip).limit(limit).all()
     
-    return [DubbingJobResponse.from_orm(job) for job in jobs]
+    # Returning a Response skips FastAPI's second response_model pass, which
+    # stays on the route only to document the schema
+    page = _JOB_LIST_ADAPTER.validate_python(jobs, from_attributes=True)
+    return Response(_JOB_LIST_ADAPTER.dump_json(page), media_type="application/json")
 
 
 @router.get("/preview/{job_id}")
@@ -27,6 +27,8 @@ class Settings(BaseSettings):
     DATABASE_URL: str = Field(..., description="PostgreSQL database URL")
     DATABASE_POOL_SIZE: int = 10
     DATABASE_MAX_OVERFLOW: int = 20
+    DATABASE_POOL_TIMEOUT: int = 30  # Seconds to wait for a free connection
+    DATABASE_POOL_RECYCLE: int = 1800  # Seconds before a pooled connection is replaced
     
     # Redis
     REDIS_URL: str = Field(default="redis://localhost:6379/0")
@@ -37,6 +39,7 @@ class Settings(BaseSettings):
     
     # File Storage
     UPLOAD_DIR: str = Field(default="./uploads")
+    CACHE_DIR: str = Field(default="./cache")
     MAX_FILE_SIZE: int = Field(default=500 * 1024 * 1024)  # 500MB
     ALLOWED_VIDEO_FORMATS: List[str] = ["mp4", "mov", "avi", "mkv"]
     ALLOWED_AUDIO_FORMATS: List[str] = ["wav", "mp3", "aac", "flac"]
@@ -50,6 +53,7 @@ class Settings(BaseSettings):
     
     # Translation Settings
     TRANSLATION_MODEL: str = Field(default="seamlessM4T")
+    BATCH_TRANSLATION: bool = Field(default=True)  # One /translate_multi call for all targets
     SUPPORTED_LANGUAGES: List[str] = Field(default=[
         "en", "es", "fr", "de", "it", "pt", "ru", "zh", "ja", "ko",
         "ar", "hi", "th", "vi", "tr", "pl", "nl", "sv", "da", "no",
@@ -75,6 +79,8 @@ class Settings(BaseSettings):
     
     # Processing
     MAX_CONCURRENT_JOBS: int = Field(default=5)
+    MAX_CONCURRENT_AI_CALLS: int = Field(default=8)  # Per-job fan-out to AI services
+    PIPELINE_PREFETCH: int = Field(default=2)  # Items buffered between dubbing stages
     JOB_TIMEOUT: int = Field(default=3600)  # 1 hour
     CLEANUP_INTERVAL: int = Field(default=86400)  # 24 hours
     
@@ -85,6 +91,7 @@ class Settings(BaseSettings):
     # Logging
     LOG_LEVEL: str = Field(default="INFO")
     LOG_FORMAT: str = Field(default="json")
+    SQL_DEBUG_REPR: bool = Field(default=False)  # Full model reprs instead of id-only
     
     # Ethical AI
     ENABLE_WATERMARKING: bool = Field(default=True)
@@ -2,10 +2,13 @@
 Database configuration and session management
 """
 
-from sqlalchemy import create_engine, MetaData
+from contextlib import contextmanager
+from sqlalchemy import create_engine, MetaData, text
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.pool import QueuePool
+from datetime import date
+from prometheus_client import Gauge, Histogram
 import structlog
 
 from app.core.config import get_settings
@@ -16,21 +19,53 @@ settings = get_settings()
 # Create SQLAlchemy engine
 engine = create_engine(
     settings.DATABASE_URL,
+    poolclass=QueuePool,
     pool_size=settings.DATABASE_POOL_SIZE,
     max_overflow=settings.DATABASE_MAX_OVERFLOW,
+    pool_timeout=settings.DATABASE_POOL_TIMEOUT,
+    pool_recycle=settings.DATABASE_POOL_RECYCLE,
     pool_pre_ping=True,
     echo=settings.DEBUG,
 )
 
+# Pool metrics
+DB_POOL_CHECKED_OUT = Gauge("db_pool_checked_out", "Database connections currently checked out")
+DB_POOL_CHECKED_OUT.set_function(lambda: engine.pool.checkedout())
+DB_POOL_ACQUIRE_SECONDS = Histogram(
+    "db_pool_acquire_seconds",
+    "Time to acquire a database connection for a request"
+)
+
 # Create SessionLocal class
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 # Create Base class for models
 Base = declarative_base()
 
+# Model __repr__ only formats more than the primary key when enabled
+DEBUG_REPR = settings.SQL_DEBUG_REPR
+
 # Metadata for migrations
 metadata = MetaData()
 
+# Tables declared PARTITION BY RANGE (created_at) with monthly children
+PARTITIONED_TABLES = ("jobs", "translations")
+
+
+def hms_sql(column: str) -> str:
+    """SQL expression formatting a seconds column as HH:MM:SS.
+
+    Built only from immutable functions so it can back a STORED
+    generated column (``to_char`` and text->interval casts are STABLE).
+    """
+    secs = f"floor(coalesce({column}, 0))::bigint"
+    hours = f"({secs} / 3600)::text"
+    return (
+        f"lpad({hours}, greatest(length({hours}), 2), '0') || ':' || "
+        f"lpad(({secs} % 3600 / 60)::text, 2, '0') || ':' || "
+        f"lpad(({secs} % 60)::text, 2, '0')"
+    )
+
 
 async def init_db():
     """Initialize database"""
@@ -40,6 +75,8 @@ async def init_db():
         
         # Create all tables
         Base.metadata.create_all(bind=engine)
+        if engine.dialect.name == "postgresql":
+            ensure_monthly_partitions()
         logger.info("Database initialized successfully")
         
     except Exception as e:
@@ -47,10 +84,79 @@ async def init_db():
         raise
 
 
+def ensure_monthly_partitions(months_ahead: int = 2):
+    """Create created_at partitions for this month and the next ``months_ahead``.
+
+    Runs at startup and daily from Celery beat, so each month's partition exists
+    well before its first row. There is no DEFAULT partition: it would block
+    creating any month it already holds rows for. One left by an earlier
+    release is emptied into monthly partitions and dropped. Old months can be
+    dropped with ``ALTER TABLE ... DETACH PARTITION`` instead of DELETE.
+    """
+    today = date.today()
+    months = [_add_months(date(today.year, today.month, 1), i) for i in range(months_ahead + 1)]
+    
+    with engine.begin() as conn:
+        # Startup and the beat task may run this concurrently
+        conn.execute(text("SELECT pg_advisory_xact_lock(hashtext('ensure_monthly_partitions'))"))
+        for table in PARTITIONED_TABLES:
+            _drop_default_partition(conn, table)
+            for start in months:
+                _create_month_partition(conn, table, start)
+
+
+def _add_months(start: date, months: int) -> date:
+    """First day of the month ``months`` after ``start``"""
+    year, month = divmod(start.year * 12 + start.month - 1 + months, 12)
+    return date(year, month + 1, 1)
+
+
+def _create_month_partition(conn, table: str, start: date):
+    """Create the partition of ``table`` for the UTC month starting at ``start``"""
+    end = _add_months(start, 1)
+    conn.execute(text(
+        f"CREATE TABLE IF NOT EXISTS {table}_{start:%Y_%m} PARTITION OF {table} "
+        f"FOR VALUES FROM ('{start.isoformat()} 00:00:00+00') TO ('{end.isoformat()} 00:00:00+00')"
+    ))
+
+
+def _drop_default_partition(conn, table: str):
+    """Move rows out of a legacy DEFAULT partition into monthly ones and drop it"""
+    default = f"{table}_default"
+    if conn.execute(text("SELECT to_regclass(:name)"), {"name": default}).scalar() is None:
+        return
+    
+    # Deleting and re-inserting keeps row triggers (project progress) balanced
+    staged = f"{default}_staged"
+    conn.execute(text(f"CREATE TEMP TABLE {staged} ON COMMIT DROP AS SELECT * FROM {default}"))
+    conn.execute(text(f"DELETE FROM {default}"))
+    starts = conn.execute(text(
+        f"SELECT DISTINCT date_trunc('month', created_at AT TIME ZONE 'UTC')::date FROM {staged}"
+    )).scalars().all()
+    for start in starts:
+        _create_month_partition(conn, table, start)
+    conn.execute(text(f"DROP TABLE {default}"))
+    conn.execute(text(f"INSERT INTO {table} SELECT * FROM {staged}"))
+    logger.info("Moved rows out of default partition", table=table, months=len(starts))
+
+
+@contextmanager
+def no_expire_on_commit(session):
+    """Keep loaded attributes valid across commits made inside the block"""
+    previous = session.expire_on_commit
+    session.expire_on_commit = False
+    try:
+        yield session
+    finally:
+        session.expire_on_commit = previous
+
+
 def get_db():
     """Dependency to get database session"""
     db = SessionLocal()
     try:
+        with DB_POOL_ACQUIRE_SECONDS.time():
+            db.connection()
         yield db
     finally:
         db.close()
@@ -0,0 +1,31 @@
+"""
+Structured logging configuration
+"""
+
+import logging
+
+import orjson
+import structlog
+
+from app.core.config import get_settings
+
+settings = get_settings()
+
+
+def configure_logging():
+    """Configure structlog for fast JSON output"""
+    level = logging.getLevelName(settings.LOG_LEVEL.upper())
+    
+    structlog.configure(
+        processors=[
+            structlog.contextvars.merge_contextvars,
+            structlog.processors.add_log_level,
+            structlog.processors.TimeStamper(fmt="iso", utc=True),
+            structlog.processors.format_exc_info,
+            structlog.processors.JSONRenderer(serializer=orjson.dumps),
+        ],
+        # Calls below the level are no-ops; nothing is built or encoded
+        wrapper_class=structlog.make_filtering_bound_logger(level),
+        logger_factory=structlog.BytesLoggerFactory(),
+        cache_logger_on_first_use=True,
+    )
\ No newline at end of file
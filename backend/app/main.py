@@ -7,15 +7,20 @@ from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 from fastapi.responses import JSONResponse
+from prometheus_client import make_asgi_app
 import structlog
 import time
 
 from app.core.config import get_settings
 from app.core.database import init_db
+from app.core.logging import configure_logging
+from app.services.dubbing import close_http_client
+from app.services.progress import close_progress_bus
 from app.api.v1 import api_router
 from app.core.exceptions import DubbingException
 
 
+configure_logging()
 logger = structlog.get_logger()
 settings = get_settings()
 
@@ -29,6 +34,8 @@ async def lifespan(app: FastAPI):
     yield
     # Shutdown
     logger.info("Shutting down application")
+    await close_http_client()
+    await close_progress_bus()
 
 
 app = FastAPI(
@@ -119,6 +126,9 @@ async def health_check():
 # Include API routes
 app.include_router(api_router, prefix="/api/v1")
 
+# Prometheus scrape endpoint
+app.mount("/metrics", make_asgi_app())
+
 
 if __name__ == "__main__":
     import uvicorn
@@ -5,7 +5,7 @@ Database models for the Multilingual AI Video Dubbing Platform
 from .user import User, UserRole
 from .project import Project, ProjectStatus
 from .job import Job, JobStatus, JobType
-from .media import MediaFile, MediaType
+from .media import MediaFile, MediaType, MediaFlag
 from .translation import Translation, TranslationStatus
 from .voice import VoiceProfile, VoiceClone
 from .ethics import ConsentRecord, WatermarkRecord, ProvenanceRecord
@@ -20,6 +20,7 @@ __all__ = [
     "JobType",
     "MediaFile",
     "MediaType",
+    "MediaFlag",
     "Translation",
     "TranslationStatus",
     "VoiceProfile",
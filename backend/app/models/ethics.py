@@ -4,12 +4,13 @@ Ethics and compliance models for consent, watermarking, and provenance
 
 from datetime import datetime
 from enum import Enum
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, ForeignKey, Float
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, ForeignKey, Float, Index, and_, or_, cast, bindparam
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import relationship
 from sqlalchemy.dialects.postgresql import UUID, ENUM, JSON
 import uuid
 
-from app.core.database import Base
+from app.core.database import Base, DEBUG_REPR
 
 
 class ConsentRecord(Base):
@@ -53,13 +54,15 @@ class ConsentRecord(Base):
     revoked_at = Column(DateTime)
     
     # Relationships
-    user = relationship("User", back_populates="consent_records")
-    project = relationship("Project", back_populates="consent_records")
+    user = relationship("User", back_populates="consent_records", lazy="raise")
+    project = relationship("Project", back_populates="consent_records", lazy="raise")
     
     def __repr__(self):
+        if not DEBUG_REPR:
+            return f"<ConsentRecord {self.id}>"
         return f"<ConsentRecord(id={self.id}, type={self.consent_type}, granted={self.is_granted})>"
     
-    @property
+    @hybrid_property
     def is_active(self) -> bool:
         """Check if consent is active"""
         if not self.is_granted or self.revoked_at:
@@ -68,6 +71,18 @@ class ConsentRecord(Base):
             return False
         return True
     
+    @is_active.expression
+    def is_active(cls):
+        """SQL form of is_active for filters and aggregates"""
+        return and_(
+            cls.is_granted.is_(True),
+            cls.revoked_at.is_(None),
+            # Evaluated per execution, so compiled and cached statements stay current
+            or_(cls.expiry_date.is_(None), cls.expiry_date >= bindparam(
+                "now", type_=DateTime(), callable_=datetime.utcnow, unique=True
+            ))
+        )
+    
     @property
     def is_expired(self) -> bool:
         """Check if consent is expired"""
@@ -134,9 +149,11 @@ class WatermarkRecord(Base):
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
     # Relationships
-    project = relationship("Project", back_populates="watermark_records")
+    project = relationship("Project", back_populates="watermark_records", lazy="raise")
     
     def __repr__(self):
+        if not DEBUG_REPR:
+            return f"<WatermarkRecord {self.id}>"
         return f"<WatermarkRecord(id={self.id}, type={self.watermark_type}, method={self.watermark_method})>"
     
     @property
@@ -196,17 +213,35 @@ class ProvenanceRecord(Base):
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
+    __table_args__ = (
+        # Latest record per project is a single index seek
+        Index("ix_provenance_records_project_created", project_id, created_at.desc()),
+    )
+    
     # Relationships
-    project = relationship("Project", back_populates="provenance_records")
+    project = relationship("Project", back_populates="provenance_records", lazy="raise")
     
     def __repr__(self):
+        if not DEBUG_REPR:
+            return f"<ProvenanceRecord {self.id}>"
         return f"<ProvenanceRecord(id={self.id}, content_type={self.content_type})>"
     
-    @property
+    @hybrid_property
     def is_c2pa_compliant(self) -> bool:
         """Check if record is C2PA compliant"""
         return bool(self.c2pa_manifest and self.c2pa_signature)
     
+    @is_c2pa_compliant.expression
+    def is_c2pa_compliant(cls):
+        """SQL form of is_c2pa_compliant for filters and aggregates"""
+        return and_(
+            cls.c2pa_manifest.is_not(None),
+            # Plain comparisons instead of NOT IN, so precompiled statements need no expansion
+            *(cast(cls.c2pa_manifest, Text) != empty for empty in ("null", "{}", "[]")),
+            cls.c2pa_signature.is_not(None),
+            cls.c2pa_signature != ""
+        )
+    
     @property
     def processing_step_count(self) -> int:
         """Get number of processing steps"""
@@ -215,22 +250,26 @@ class ProvenanceRecord(Base):
     def add_processing_step(self, step_name: str, model_name: str, 
                           parameters: dict, timestamp: datetime = None):
         """Add a processing step to the chain"""
-        if not self.processing_chain:
-            self.processing_chain = []
-        if not self.models_used:
-            self.models_used = []
-        
-        step = {
-            "step": step_name,
-            "model": model_name,
-            "parameters": parameters,
-            "timestamp": (timestamp or datetime.utcnow()).isoformat()
-        }
+        self.add_processing_steps([(step_name, model_name, parameters, timestamp)])
+    
+    def add_processing_steps(self, steps: list):
+        """Add (step_name, model_name, parameters, timestamp) steps in one change"""
+        chain = list(self.processing_chain or [])
+        models_used = list(self.models_used or [])
         
-        self.processing_chain.append(step)
-        if model_name not in self.models_used:
-            self.models_used.append(model_name)
+        for step_name, model_name, parameters, timestamp in steps:
+            chain.append({
+                "step": step_name,
+                "model": model_name,
+                "parameters": parameters,
+                "timestamp": (timestamp or datetime.utcnow()).isoformat()
+            })
+            if model_name not in models_used:
+                models_used.append(model_name)
         
+        # Plain JSON columns only see reassignment, not in-place appends
+        self.processing_chain = chain
+        self.models_used = models_used
         self.updated_at = datetime.utcnow()
     
     def add_human_review(self, reviewer: str, notes: str = None):
@@ -4,12 +4,12 @@ Job model for tracking processing tasks
 
 from datetime import datetime
 from enum import Enum
-from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, Float
+from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, Float, Index, func, DDL, event
 from sqlalchemy.orm import relationship
 from sqlalchemy.dialects.postgresql import UUID, ENUM, JSON
 import uuid
 
-from app.core.database import Base
+from app.core.database import Base, DEBUG_REPR
 
 
 class JobStatus(str, Enum):
@@ -36,10 +36,18 @@ class JobType(str, Enum):
     FULL_DUBBING = "full_dubbing"
 
 
+_JOB_ACTIVE_STATUSES = frozenset({JobStatus.PENDING, JobStatus.RUNNING, JobStatus.RETRYING})
+
+
 class Job(Base):
     """Job model for processing tasks"""
     
     __tablename__ = "jobs"
+    __table_args__ = (
+        Index("ix_jobs_created_brin", "created_at", postgresql_using="brin",
+              postgresql_with={"pages_per_range": 32}),
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     
@@ -70,7 +78,8 @@ class Job(Base):
     task_id = Column(String(255))  # Celery task ID
     
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    # Partition key; part of the table primary key, but rows are identified by id alone
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False, primary_key=True)
     started_at = Column(DateTime)
     completed_at = Column(DateTime)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -79,17 +88,24 @@ class Job(Base):
     estimated_duration = Column(Integer)  # seconds
     actual_duration = Column(Integer)  # seconds
     
+    # Optimistic concurrency: bumped on every UPDATE, stale writers raise StaleDataError
+    version = Column(Integer, nullable=False, default=0, server_default="0")
+    
+    __mapper_args__ = {"primary_key": [id], "version_id_col": version}
+    
     # Relationships
-    user = relationship("User", back_populates="jobs")
-    project = relationship("Project", back_populates="jobs")
+    user = relationship("User", back_populates="jobs", lazy="raise")
+    project = relationship("Project", back_populates="jobs", lazy="raise")
     
     def __repr__(self):
+        if not DEBUG_REPR:
+            return f"<Job {self.id}>"
         return f"<Job(id={self.id}, type={self.type}, status={self.status})>"
     
     @property
     def is_active(self) -> bool:
         """Check if job is active"""
-        return self.status in [JobStatus.PENDING, JobStatus.RUNNING, JobStatus.RETRYING]
+        return self.status in _JOB_ACTIVE_STATUSES
     
     @property
     def is_completed(self) -> bool:
@@ -110,7 +126,6 @@ class Job(Base):
         """Mark job as started"""
         self.status = JobStatus.RUNNING
         self.started_at = datetime.utcnow()
-        self.updated_at = datetime.utcnow()
         if worker_id:
             self.worker_id = worker_id
         if task_id:
@@ -121,7 +136,6 @@ class Job(Base):
         self.status = JobStatus.COMPLETED
         self.progress = 1.0
         self.completed_at = datetime.utcnow()
-        self.updated_at = datetime.utcnow()
         
         if output_data:
             self.output_data = output_data
@@ -137,7 +151,6 @@ class Job(Base):
         """Mark job as failed"""
         self.status = JobStatus.FAILED
         self.error_message = error_message
-        self.updated_at = datetime.utcnow()
         
         # Calculate actual duration if started
         if self.started_at:
@@ -152,7 +165,7 @@ class Job(Base):
         self.status = JobStatus.RETRYING
         self.retry_count += 1
         self.error_message = None
-        self.updated_at = datetime.utcnow()
+        self.progress = 0.0
     
     def cancel(self):
         """Cancel job"""
@@ -160,9 +173,57 @@ class Job(Base):
             raise ValueError("Cannot cancel completed job")
         
         self.status = JobStatus.CANCELLED
-        self.updated_at = datetime.utcnow()
     
     def update_progress(self, progress: float):
         """Update job progress"""
         self.progress = max(0.0, min(1.0, progress))
-        self.updated_at = datetime.utcnow()
\ No newline at end of file
+
+
+# Keep projects.progress as the mean of its jobs' progress, maintained
+# incrementally from per-row deltas instead of re-aggregating jobs
+PROJECT_PROGRESS_FUNCTION = DDL("""
+CREATE OR REPLACE FUNCTION project_progress_delta() RETURNS trigger AS $$
+DECLARE
+    delta_sum double precision;
+    delta_count integer;
+    target_id uuid;
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        delta_sum := COALESCE(NEW.progress, 0);
+        delta_count := 1;
+        target_id := NEW.project_id;
+    ELSIF TG_OP = 'DELETE' THEN
+        delta_sum := -COALESCE(OLD.progress, 0);
+        delta_count := -1;
+        target_id := OLD.project_id;
+    ELSE
+        delta_sum := COALESCE(NEW.progress, 0) - COALESCE(OLD.progress, 0);
+        delta_count := 0;
+        target_id := NEW.project_id;
+    END IF;
+
+    UPDATE projects
+       SET progress_sum = progress_sum + delta_sum,
+           job_count = job_count + delta_count,
+           progress = CASE WHEN job_count + delta_count > 0
+                           THEN (progress_sum + delta_sum) / (job_count + delta_count)
+                           ELSE 0 END
+     WHERE id = target_id;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+""")
+
+PROJECT_PROGRESS_TRIGGERS = DDL("""
+CREATE TRIGGER jobs_progress_count
+AFTER INSERT OR DELETE ON jobs
+FOR EACH ROW EXECUTE FUNCTION project_progress_delta();
+
+CREATE TRIGGER jobs_progress_agg
+AFTER UPDATE OF progress ON jobs
+FOR EACH ROW WHEN (OLD.progress IS DISTINCT FROM NEW.progress)
+EXECUTE FUNCTION project_progress_delta();
+""")
+
+event.listen(Job.__table__, "after_create", PROJECT_PROGRESS_FUNCTION.execute_if(dialect="postgresql"))
+event.listen(Job.__table__, "after_create", PROJECT_PROGRESS_TRIGGERS.execute_if(dialect="postgresql"))
\ No newline at end of file
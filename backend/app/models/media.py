@@ -3,13 +3,13 @@ Media file model for storing video and audio files
 """
 
 from datetime import datetime
-from enum import Enum
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, ForeignKey, Float, BigInteger
+from enum import Enum, IntFlag
+from sqlalchemy import Column, Integer, SmallInteger, String, DateTime, Boolean, Text, ForeignKey, Float, BigInteger, Computed, Index, text, func
 from sqlalchemy.orm import relationship
 from sqlalchemy.dialects.postgresql import UUID, ENUM, JSON
 import uuid
 
-from app.core.database import Base
+from app.core.database import Base, hms_sql, DEBUG_REPR
 
 
 class MediaType(str, Enum):
@@ -21,10 +21,37 @@ class MediaType(str, Enum):
     SUBTITLE = "subtitle"
 
 
+class MediaFlag(IntFlag):
+    """Bits packed into ``MediaFile.media_flags``"""
+    HD = 1
+    UHD_4K = 2
+    VIDEO = 4
+    AUDIO = 8
+    IMAGE = 16
+
+
+# ENUM columns store member names, so compare against VIDEO/AUDIO/IMAGE
+MEDIA_FLAGS_SQL = (
+    "(CASE WHEN height >= 720 THEN 1 ELSE 0 END"
+    " | CASE WHEN height >= 2160 THEN 2 ELSE 0 END"
+    " | CASE media_type WHEN 'VIDEO' THEN 4 WHEN 'AUDIO' THEN 8 WHEN 'IMAGE' THEN 16 ELSE 0 END"
+    ")::smallint"
+)
+
+
 class MediaFile(Base):
     """Media file model"""
     
     __tablename__ = "media_files"
+    __table_args__ = (
+        Index("ix_media_files_created_brin", "created_at", postgresql_using="brin",
+              postgresql_with={"pages_per_range": 32}),
+        Index(
+            "ix_media_files_4k",
+            "media_flags",
+            postgresql_where=text(f"media_flags & {int(MediaFlag.UHD_4K)} = {int(MediaFlag.UHD_4K)}"),
+        ),
+    )
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     
@@ -45,12 +72,14 @@ class MediaFile(Base):
     
     # Media properties
     duration = Column(Float)  # seconds (for video/audio)
+    duration_hms = Column(String(16), Computed(hms_sql("duration"), persisted=True))  # HH:MM:SS
     width = Column(Integer)  # pixels (for video/image)
     height = Column(Integer)  # pixels (for video/image)
     fps = Column(Float)  # frames per second (for video)
     bitrate = Column(Integer)  # bits per second (for video/audio)
     sample_rate = Column(Integer)  # Hz (for audio)
     channels = Column(Integer)  # audio channels
+    media_flags = Column(SmallInteger, Computed(MEDIA_FLAGS_SQL, persisted=True))  # MediaFlag bits
     
     # Processing status
     is_processed = Column(Boolean, default=False)
@@ -61,29 +90,51 @@ class MediaFile(Base):
     content_description = Column(Text)
     
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
     # Relationships
-    project = relationship("Project", back_populates="media_files")
+    project = relationship("Project", back_populates="media_files", lazy="raise")
     
     def __repr__(self):
+        if not DEBUG_REPR:
+            return f"<MediaFile {self.id}>"
         return f"<MediaFile(id={self.id}, filename={self.filename}, type={self.media_type})>"
     
+    @property
+    def flags(self) -> MediaFlag:
+        """Get packed media flags"""
+        if self.media_flags is not None:
+            return MediaFlag(self.media_flags)
+        
+        # Not yet flushed, so the generated column is unavailable
+        flags = MediaFlag(0)
+        if self.height and self.height >= 720:
+            flags |= MediaFlag.HD
+        if self.height and self.height >= 2160:
+            flags |= MediaFlag.UHD_4K
+        if self.media_type == MediaType.VIDEO:
+            flags |= MediaFlag.VIDEO
+        elif self.media_type == MediaType.AUDIO:
+            flags |= MediaFlag.AUDIO
+        elif self.media_type == MediaType.IMAGE:
+            flags |= MediaFlag.IMAGE
+        return flags
+    
     @property
     def is_video(self) -> bool:
         """Check if file is video"""
-        return self.media_type == MediaType.VIDEO
+        return bool(self.flags & MediaFlag.VIDEO)
     
     @property
     def is_audio(self) -> bool:
         """Check if file is audio"""
-        return self.media_type == MediaType.AUDIO
+        return bool(self.flags & MediaFlag.AUDIO)
     
     @property
     def is_image(self) -> bool:
         """Check if file is image"""
-        return self.media_type == MediaType.IMAGE
+        return bool(self.flags & MediaFlag.IMAGE)
     
     @property
     def file_size_mb(self) -> float:
@@ -93,6 +144,10 @@ class MediaFile(Base):
     @property
     def duration_formatted(self) -> str:
         """Get formatted duration (HH:MM:SS)"""
+        if self.duration_hms is not None:
+            return self.duration_hms
+        
+        # Not yet flushed, so the generated column is unavailable
         if not self.duration:
             return "00:00:00"
         
@@ -117,11 +172,11 @@ class MediaFile(Base):
     
     def is_hd(self) -> bool:
         """Check if video is HD (720p or higher)"""
-        return self.height and self.height >= 720
+        return bool(self.flags & MediaFlag.HD)
     
     def is_4k(self) -> bool:
         """Check if video is 4K"""
-        return self.height and self.height >= 2160
+        return bool(self.flags & MediaFlag.UHD_4K)
     
     def update_processing_status(self, is_processed: bool, metadata: dict = None):
         """Update processing status"""
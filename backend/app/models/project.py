@@ -4,12 +4,12 @@ Project model for organizing dubbing work
 
 from datetime import datetime
 from enum import Enum
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, ForeignKey, Float
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, ForeignKey, Float, Index, func
 from sqlalchemy.orm import relationship
 from sqlalchemy.dialects.postgresql import UUID, ENUM, JSON
 import uuid
 
-from app.core.database import Base
+from app.core.database import Base, DEBUG_REPR
 
 
 class ProjectStatus(str, Enum):
@@ -22,10 +22,17 @@ class ProjectStatus(str, Enum):
     CANCELLED = "cancelled"
 
 
+_PROJECT_ACTIVE_STATUSES = frozenset({ProjectStatus.DRAFT, ProjectStatus.PROCESSING, ProjectStatus.REVIEW})
+
+
 class Project(Base):
     """Project model"""
     
     __tablename__ = "projects"
+    __table_args__ = (
+        Index("ix_projects_created_brin", "created_at", postgresql_using="brin",
+              postgresql_with={"pages_per_range": 32}),
+    )
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     name = Column(String(255), nullable=False)
@@ -36,7 +43,9 @@ class Project(Base):
     
     # Status and progress
     status = Column(ENUM(ProjectStatus), default=ProjectStatus.DRAFT, nullable=False)
-    progress = Column(Float, default=0.0)  # 0.0 to 1.0
+    progress = Column(Float, default=0.0)  # 0.0 to 1.0, mean job progress (jobs trigger)
+    progress_sum = Column(Float, default=0.0, server_default="0", nullable=False)  # Sum of job progress
+    job_count = Column(Integer, default=0, server_default="0", nullable=False)
     
     # Languages
     source_language = Column(String(10), nullable=False)  # ISO 639-1 code
@@ -57,12 +66,12 @@ class Project(Base):
     enable_provenance = Column(Boolean, default=True)
     
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     completed_at = Column(DateTime)
     
     # Relationships
-    owner = relationship("User", back_populates="projects")
+    owner = relationship("User", back_populates="projects", lazy="raise")
     media_files = relationship("MediaFile", back_populates="project", cascade="all, delete-orphan")
     jobs = relationship("Job", back_populates="project", cascade="all, delete-orphan")
     translations = relationship("Translation", back_populates="project", cascade="all, delete-orphan")
@@ -71,12 +80,14 @@ class Project(Base):
     provenance_records = relationship("ProvenanceRecord", back_populates="project")
     
     def __repr__(self):
+        if not DEBUG_REPR:
+            return f"<Project {self.id}>"
         return f"<Project(id={self.id}, name={self.name}, status={self.status})>"
     
     @property
     def is_active(self) -> bool:
         """Check if project is active"""
-        return self.status in [ProjectStatus.DRAFT, ProjectStatus.PROCESSING, ProjectStatus.REVIEW]
+        return self.status in _PROJECT_ACTIVE_STATUSES
     
     @property
     def is_completed(self) -> bool:
@@ -93,7 +104,7 @@ class Project(Base):
         return len(self.target_languages) if self.target_languages else 0
     
     def update_progress(self, progress: float):
-        """Update project progress"""
+        """Override project progress (normally maintained by the jobs trigger)"""
         self.progress = max(0.0, min(1.0, progress))
         self.updated_at = datetime.utcnow()
     
@@ -2,14 +2,18 @@
 Translation model for managing multilingual content
 """
 
+import re
 from datetime import datetime
 from enum import Enum
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, ForeignKey, Float
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, ForeignKey, Float, Index, func
 from sqlalchemy.orm import relationship
 from sqlalchemy.dialects.postgresql import UUID, ENUM, JSON
 import uuid
 
-from app.core.database import Base
+from app.core.database import Base, DEBUG_REPR
+
+# Same tokens as str.split(), matched without building the list
+_WORD_RE = re.compile(r"\S+")
 
 
 class TranslationStatus(str, Enum):
@@ -27,6 +31,11 @@ class Translation(Base):
     """Translation model"""
     
     __tablename__ = "translations"
+    __table_args__ = (
+        Index("ix_translations_created_brin", "created_at", postgresql_using="brin",
+              postgresql_with={"pages_per_range": 32}),
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     
@@ -62,15 +71,23 @@ class Translation(Base):
     processing_time = Column(Float)  # Processing time in seconds
     
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    # Partition key; part of the table primary key, but rows are identified by id alone
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False, primary_key=True)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     reviewed_at = Column(DateTime)
     
+    # Optimistic concurrency: bumped on every UPDATE, stale writers raise StaleDataError
+    version = Column(Integer, nullable=False, default=0, server_default="0")
+    
+    __mapper_args__ = {"primary_key": [id], "version_id_col": version}
+    
     # Relationships
-    project = relationship("Project", back_populates="translations")
-    reviewer = relationship("User", foreign_keys=[reviewer_id])
+    project = relationship("Project", back_populates="translations", lazy="raise")
+    reviewer = relationship("User", foreign_keys=[reviewer_id], lazy="raise")
     
     def __repr__(self):
+        if not DEBUG_REPR:
+            return f"<Translation {self.id}>"
         return f"<Translation(id={self.id}, {self.source_language}->{self.target_language}, status={self.status})>"
     
     @property
@@ -115,7 +132,6 @@ class Translation(Base):
         """Mark translation as completed"""
         self.status = TranslationStatus.COMPLETED
         self.translated_text = translated_text
-        self.updated_at = datetime.utcnow()
         
         if confidence_score is not None:
             self.confidence_score = confidence_score
@@ -130,14 +146,12 @@ class Translation(Base):
             raise ValueError("Translation must be completed before review")
         
         self.status = TranslationStatus.REVIEW
-        self.updated_at = datetime.utcnow()
     
     def approve(self, reviewer_id: uuid.UUID, reviewed_text: str = None, notes: str = None):
         """Approve translation"""
         self.status = TranslationStatus.APPROVED
         self.reviewer_id = reviewer_id
         self.reviewed_at = datetime.utcnow()
-        self.updated_at = datetime.utcnow()
         
         if reviewed_text:
             self.reviewed_text = reviewed_text
@@ -150,13 +164,11 @@ class Translation(Base):
         self.reviewer_id = reviewer_id
         self.review_notes = notes
         self.reviewed_at = datetime.utcnow()
-        self.updated_at = datetime.utcnow()
     
     def fail(self, error_message: str):
         """Mark translation as failed"""
         self.status = TranslationStatus.FAILED
         self.review_notes = error_message
-        self.updated_at = datetime.utcnow()
     
     def calculate_word_count(self, text_type: str = "source") -> int:
         """Calculate word count for specified text"""
@@ -169,4 +181,4 @@ class Translation(Base):
         else:
             text = self.final_text
         
-        return len(text.split()) if text else 0
\ No newline at end of file
+        return sum(1 for _ in _WORD_RE.finditer(text)) if text else 0
\ No newline at end of file
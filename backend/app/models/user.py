@@ -6,10 +6,10 @@ from datetime import datetime
 from enum import Enum
 from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text
 from sqlalchemy.orm import relationship
-from sqlalchemy.dialects.postgresql import UUID, ENUM
+from sqlalchemy.dialects.postgresql import UUID, ENUM, JSONB
 import uuid
 
-from app.core.database import Base
+from app.core.database import Base, DEBUG_REPR
 
 
 class UserRole(str, Enum):
@@ -20,6 +20,10 @@ class UserRole(str, Enum):
     VIEWER = "viewer"
 
 
+_PROJECT_CREATOR_ROLES = frozenset({UserRole.ADMIN, UserRole.CREATOR})
+_TRANSLATION_REVIEWER_ROLES = frozenset({UserRole.ADMIN, UserRole.REVIEWER})
+
+
 class User(Base):
     """User model"""
     
@@ -42,8 +46,8 @@ class User(Base):
     website = Column(String(500))
     
     # Preferences
-    preferred_languages = Column(String(500))  # JSON string of language codes
-    notification_preferences = Column(Text)  # JSON string
+    preferred_languages = Column(JSONB, server_default="[]")  # List of language codes
+    notification_preferences = Column(JSONB, server_default="{}")
     
     # Timestamps
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
@@ -56,6 +60,8 @@ class User(Base):
     consent_records = relationship("ConsentRecord", back_populates="user")
     
     def __repr__(self):
+        if not DEBUG_REPR:
+            return f"<User {self.id}>"
         return f"<User(id={self.id}, email={self.email}, role={self.role})>"
     
     @property
@@ -66,9 +72,9 @@ class User(Base):
     @property
     def can_create_projects(self) -> bool:
         """Check if user can create projects"""
-        return self.role in [UserRole.ADMIN, UserRole.CREATOR]
+        return self.role in _PROJECT_CREATOR_ROLES
     
     @property
     def can_review_translations(self) -> bool:
         """Check if user can review translations"""
-        return self.role in [UserRole.ADMIN, UserRole.REVIEWER]
\ No newline at end of file
+        return self.role in _TRANSLATION_REVIEWER_ROLES
\ No newline at end of file
@@ -4,15 +4,30 @@ Voice profile and cloning models
 
 from datetime import datetime
 from enum import Enum
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, ForeignKey, Float
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, ForeignKey, Float, Computed, update
+from sqlalchemy.orm import relationship, Session
 from sqlalchemy.dialects.postgresql import UUID, ENUM, JSON
 import uuid
 
-from app.core.database import Base
+from app.core.database import Base, hms_sql, DEBUG_REPR
 
 
-class VoiceProfile(Base):
+class UsageCounterMixin:
+    """Atomic usage counter updates shared by voice models"""
+    
+    @classmethod
+    def increment_usage_by(cls, db: Session, record_id: uuid.UUID, count: int = 1):
+        """Add ``count`` uses in a single UPDATE, without loading the row"""
+        if count <= 0:
+            return
+        db.execute(
+            update(cls)
+            .where(cls.id == record_id)
+            .values(usage_count=cls.usage_count + count, updated_at=datetime.utcnow())
+        )
+
+
+class VoiceProfile(UsageCounterMixin, Base):
     """Voice profile model for storing voice characteristics"""
     
     __tablename__ = "voice_profiles"
@@ -62,6 +77,8 @@ class VoiceProfile(Base):
     voice_clones = relationship("VoiceClone", back_populates="voice_profile")
     
     def __repr__(self):
+        if not DEBUG_REPR:
+            return f"<VoiceProfile {self.id}>"
         return f"<VoiceProfile(id={self.id}, name={self.name}, language={self.language})>"
     
     @property
@@ -75,7 +92,7 @@ class VoiceProfile(Base):
         self.updated_at = datetime.utcnow()
 
 
-class VoiceClone(Base):
+class VoiceClone(UsageCounterMixin, Base):
     """Voice clone model for speaker-specific voice synthesis"""
     
     __tablename__ = "voice_clones"
@@ -102,6 +119,7 @@ class VoiceClone(Base):
     # Training details
     training_steps = Column(Integer)
     training_duration = Column(Float)  # Training time in seconds
+    training_duration_hms = Column(String(16), Computed(hms_sql("training_duration"), persisted=True))
     model_size = Column(Integer)  # Model size in bytes
     
     # Supported features
@@ -120,9 +138,11 @@ class VoiceClone(Base):
     trained_at = Column(DateTime)
     
     # Relationships
-    voice_profile = relationship("VoiceProfile", back_populates="voice_clones")
+    voice_profile = relationship("VoiceProfile", back_populates="voice_clones", lazy="raise")
     
     def __repr__(self):
+        if not DEBUG_REPR:
+            return f"<VoiceClone {self.id}>"
         return f"<VoiceClone(id={self.id}, name={self.name}, speaker_id={self.speaker_id})>"
     
     @property
@@ -134,6 +154,10 @@ class VoiceClone(Base):
     @property
     def training_duration_formatted(self) -> str:
         """Get formatted training duration"""
+        if self.training_duration_hms is not None:
+            return self.training_duration_hms
+        
+        # Not yet flushed, so the generated column is unavailable
         if not self.training_duration:
             return "00:00:00"
         
@@ -4,9 +4,15 @@ Pydantic schemas for dubbing operations
 
 from datetime import datetime
 from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from enum import Enum
 
+# Subset for validation
+_VALID_LANG_CODES = frozenset({
+    "en", "es", "fr", "de", "it", "pt", "ru", "zh", "ja", "ko",
+    "ar", "hi", "th", "vi", "tr", "pl", "nl", "sv", "da", "no"
+})
+
 
 class QualityMode(str, Enum):
     """Quality processing mode"""
@@ -24,18 +30,14 @@ class DubbingRequest(BaseModel):
     require_human_review: bool = False
     custom_settings: Optional[Dict[str, Any]] = None
     
-    @validator('target_languages')
+    @field_validator('target_languages')
+    @classmethod
     def validate_languages(cls, v):
-        """Validate language codes"""
-        valid_codes = [
-            "en", "es", "fr", "de", "it", "pt", "ru", "zh", "ja", "ko",
-            "ar", "hi", "th", "vi", "tr", "pl", "nl", "sv", "da", "no"
-        ]  # Subset for validation
-        
-        for lang in v:
-            if lang not in valid_codes:
-                raise ValueError(f"Unsupported language code: {lang}")
-        return v
+        """Validate and deduplicate language codes"""
+        unsupported = set(v) - _VALID_LANG_CODES
+        if unsupported:
+            raise ValueError(f"Unsupported language codes: {sorted(unsupported)}")
+        return list(dict.fromkeys(v))
 
 
 class DubbingJobResponse(BaseModel):
@@ -50,8 +52,7 @@ class DubbingJobResponse(BaseModel):
     source_language: Optional[str]
     error_message: Optional[str] = None
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, use_enum_values=True)
 
 
 class DubbingProgressResponse(BaseModel):
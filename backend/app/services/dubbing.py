@@ -3,24 +3,95 @@ Main dubbing service that orchestrates the entire pipeline
 """
 
 import asyncio
+import bisect
 import os
+import shutil
 import tempfile
-from typing import Dict, Any, Optional
+import uuid
+from typing import Dict, Any, Optional, Callable, Awaitable
 from datetime import datetime
 import httpx
+import orjson
 import structlog
 
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.orm.exc import StaleDataError
 from fastapi import UploadFile
 
 from app.core.config import get_settings
+from app.core.database import no_expire_on_commit
+from app.core.exceptions import FileProcessingError
 from app.models import User, Project, Job, MediaFile, JobType, JobStatus
 from app.schemas.dubbing import DubbingRequest, DubbingProgressResponse
 from app.services.ethics import EthicsService
+from app.services.progress import get_progress_bus
 
 logger = structlog.get_logger()
 settings = get_settings()
 
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Pipeline stages and the overall progress past which each one is done
+_STAGE_NAMES = (
+    "Ethics Check",
+    "Speech Recognition",
+    "Translation",
+    "Voice Synthesis",
+    "Face Animation",
+    "Quality Check",
+)
+_STAGE_THRESHOLDS = (0.1, 0.2, 0.4, 0.6, 0.8, 1.0)
+
+# (current stage, stage list) for each number of completed stages
+_STAGE_TABLE = tuple(
+    (
+        _STAGE_NAMES[done] if done < len(_STAGE_NAMES) else "Completed",
+        tuple(
+            {"name": name, "progress": 1.0 if i < done else 0.0}
+            for i, name in enumerate(_STAGE_NAMES)
+        )
+    )
+    for done in range(len(_STAGE_NAMES) + 1)
+)
+
+# Shared by every DubbingService so AI service connections are kept alive
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get the shared HTTP client for AI service calls"""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            timeout=httpx.Timeout(600.0, connect=5.0),
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+        )
+    return _http_client
+
+
+async def close_http_client():
+    """Close the shared HTTP client"""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
+def _wav_data_chunk(wav_path: str) -> tuple[Optional[int], Optional[int]]:
+    """Byte offset and length of the sample data in a RIFF/WAVE file"""
+    with open(wav_path, "rb") as f:
+        header = f.read(12)
+        if len(header) < 12 or header[:4] != b"RIFF" or header[8:] != b"WAVE":
+            return None, None
+        
+        # ffmpeg may write LIST chunks before the data, so walk the chunk headers
+        while len(chunk := f.read(8)) == 8:
+            size = int.from_bytes(chunk[4:], "little")
+            if chunk[:4] == b"data":
+                return f.tell(), size
+            f.seek(size + (size & 1), os.SEEK_CUR)
+    return None, None
+
 
 class DubbingService:
     """Main service for orchestrating the dubbing pipeline"""
@@ -29,6 +100,9 @@ class DubbingService:
         self.db = db
         self.ethics_service = EthicsService(db)
         self.ai_services_base_url = settings.AI_SERVICES_BASE_URL
+        self._http = get_http_client()
+        self._progress_bus = get_progress_bus()
+        self._ai_call_limit = asyncio.Semaphore(settings.MAX_CONCURRENT_AI_CALLS)
     
     async def create_dubbing_job(
         self,
@@ -57,8 +131,7 @@ class DubbingService:
             }
         )
         self.db.add(project)
-        self.db.commit()
-        self.db.refresh(project)
+        self.db.flush()  # Assigns project.id without committing
         
         # Save uploaded video
         video_path = await self._save_uploaded_file(video_file, project.id)
@@ -68,7 +141,7 @@ class DubbingService:
             filename=f"{project.id}_{video_file.filename}",
             original_filename=video_file.filename,
             file_path=video_path,
-            file_size=video_file.size or 0,
+            file_size=os.path.getsize(video_path),
             mime_type=video_file.content_type or "video/mp4",
             media_type="video",
             project_id=project.id
@@ -84,12 +157,13 @@ class DubbingService:
                 "video_path": video_path,
                 "target_languages": request.target_languages,
                 "source_language": request.source_language,
-                "settings": request.dict()
+                "settings": request.model_dump(mode="json", exclude_none=True)
             }
         )
         self.db.add(job)
+        
+        # Project, media file and job are written in one transaction
         self.db.commit()
-        self.db.refresh(job)
         
         logger.info(
             "Dubbing job created",
@@ -99,84 +173,150 @@ class DubbingService:
         
         return job
     
-    async def process_dubbing_job(self, job_id: str):
+    async def process_dubbing_job(self, job_id: str, worker_id: str = None, task_id: str = None):
         """Process a dubbing job through the entire pipeline"""
-        job = self.db.query(Job).filter(Job.id == job_id).first()
+        job = self._load_job(job_id, with_project=True)
         if not job:
             logger.error("Job not found", job_id=job_id)
             return
+        # lazy="raise" refuses to reload job.project if anything expires it
+        project = job.project
+        
+        # Every log line from this job, including in concurrent stages, carries job_id
+        with structlog.contextvars.bound_contextvars(job_id=job_id):
+            try:
+                job.start(worker_id=worker_id, task_id=task_id)
+                # Replaces any progress left in Redis by a previous run
+                await self._report_progress(job, 0.0)
+                await self._commit_pipeline()
+                
+                logger.info("Starting dubbing pipeline")
+                
+                # Step 1: Ethics checks
+                await self._run_ethics_checks(job, project)
+                
+                # Step 2: ASR (Automatic Speech Recognition) on the extracted audio track
+                audio_path = await self._extract_audio(job.input_data["video_path"])
+                job.input_data = {**job.input_data, "audio_path": audio_path}
+                transcript, speaker_id = await asyncio.gather(
+                    self._run_asr(job),
+                    self._enroll_speaker(job),
+                    return_exceptions=True
+                )
+                if isinstance(speaker_id, str):
+                    job.input_data = {**job.input_data, "speaker_id": speaker_id}
+                    # Committed now, since a failure later in the run rolls the session back
+                    await self._commit_pipeline()
+                for result in (transcript, speaker_id):
+                    if isinstance(result, BaseException):
+                        raise result
+                await self._report_progress(job, 0.2)
+                
+                # Steps 3-5: Translation, voice synthesis and face animation,
+                # pipelined across languages through bounded stage queues
+                target_languages = job.input_data["target_languages"]
+                step = 0.6 / (3 * len(target_languages))
+                
+                async def advance():
+                    await self._report_progress(job, job.progress + step)
+                
+                translations = {}
+                if settings.BATCH_TRANSLATION:
+                    translations = await self._run_batch_translation(job, transcript)
+                    await self._report_progress(job, job.progress + step * len(target_languages))
+                
+                animated_videos = await self._run_language_stages(job, transcript, translations, advance)
+                
+                # Step 6: Quality checks
+                quality_results = await self._run_quality_checks(job, animated_videos)
+                
+                # Step 7: Apply ethical safeguards
+                final_videos = await self._apply_ethical_safeguards(job, project, animated_videos)
+                await self._report_progress(job, 1.0)
+                
+                # Complete job
+                job.complete(
+                    output_data={
+                        "videos": final_videos,
+                        "quality_metrics": quality_results
+                    },
+                    quality_metrics=quality_results
+                )
+                await self._commit_pipeline()
+                
+                logger.info("Dubbing pipeline completed")
+                
+            except Exception as e:
+                await self._handle_pipeline_failure(job_id, e)
+    
+    async def _handle_pipeline_failure(self, job_id: str, error: Exception):
+        """Mark the job failed unless it was cancelled or changed elsewhere"""
+        # A failed flush leaves the session unusable until it is rolled back
+        await asyncio.to_thread(self.db.rollback)
+        
+        if isinstance(error, StaleDataError):
+            logger.info("Job was modified elsewhere, stopping pipeline", error=str(error))
+            return
+        
+        job = self._load_job(job_id)
+        if job is None or job.status == JobStatus.CANCELLED:
+            logger.info("Job was cancelled, stopping pipeline")
+            return
         
+        logger.error("Dubbing pipeline failed", error=str(error))
+        job.fail(str(error))
         try:
-            job.start()
-            self.db.commit()
-            
-            logger.info("Starting dubbing pipeline", job_id=job_id)
-            
-            # Step 1: Ethics checks
-            await self._run_ethics_checks(job)
-            
-            # Step 2: ASR (Automatic Speech Recognition)
-            transcript = await self._run_asr(job)
-            job.update_progress(0.2)
-            self.db.commit()
-            
-            # Step 3: Translation
-            translations = await self._run_translation(job, transcript)
-            job.update_progress(0.4)
-            self.db.commit()
-            
-            # Step 4: Voice synthesis
-            audio_files = await self._run_voice_synthesis(job, translations)
-            job.update_progress(0.6)
-            self.db.commit()
-            
-            # Step 5: Face animation
-            animated_videos = await self._run_face_animation(job, audio_files)
-            job.update_progress(0.8)
-            self.db.commit()
-            
-            # Step 6: Quality checks
-            quality_results = await self._run_quality_checks(job, animated_videos)
-            
-            # Step 7: Apply ethical safeguards
-            final_videos = await self._apply_ethical_safeguards(job, animated_videos)
-            job.update_progress(1.0)
-            
-            # Complete job
-            job.complete(
-                output_data={
-                    "videos": final_videos,
-                    "quality_metrics": quality_results
-                },
-                quality_metrics=quality_results
-            )
-            self.db.commit()
-            
-            logger.info("Dubbing pipeline completed", job_id=job_id)
-            
-        except Exception as e:
-            logger.error("Dubbing pipeline failed", job_id=job_id, error=str(e))
-            job.fail(str(e))
-            self.db.commit()
+            await asyncio.to_thread(self.db.commit)
+        except StaleDataError:
+            # Cancelled between the reload and this commit
+            await asyncio.to_thread(self.db.rollback)
+            logger.info("Job was modified elsewhere, stopping pipeline")
+    
+    async def _commit_pipeline(self):
+        """Commit without expiring the job and project loaded for the pipeline"""
+        with no_expire_on_commit(self.db):
+            await asyncio.to_thread(self.db.commit)
+    
+    def _load_job(self, job_id: str, with_project: bool = False) -> Optional[Job]:
+        """Load a job by id, from the identity map when the session already holds it"""
+        ident = uuid.UUID(str(job_id))
+        if not with_project:
+            return self.db.get(Job, ident)
+        # The endpoint's session may hold this job without its project loaded
+        return self.db.get(
+            Job,
+            ident,
+            options=[selectinload(Job.project)],
+            populate_existing=True
+        )
+    
+    async def _report_progress(self, job: Job, progress: float):
+        """Publish stage progress; it reaches the database with the next commit"""
+        job.update_progress(progress)
+        await self._progress_bus.publish(str(job.id), job.progress)
     
     async def _save_uploaded_file(self, file: UploadFile, project_id: str) -> str:
         """Save uploaded file to storage"""
         upload_dir = os.path.join(settings.UPLOAD_DIR, str(project_id))
         os.makedirs(upload_dir, exist_ok=True)
         
-        file_path = os.path.join(upload_dir, file.filename)
+        # basename() keeps client-supplied names inside the upload dir
+        file_path = os.path.join(upload_dir, os.path.basename(file.filename))
         
-        with open(file_path, "wb") as f:
-            content = await file.read()
-            f.write(content)
+        await asyncio.to_thread(self._copy_upload, file, file_path)
         
         return file_path
     
-    async def _run_ethics_checks(self, job: Job):
+    @staticmethod
+    def _copy_upload(file: UploadFile, file_path: str):
+        """Copy upload to disk in 1 MiB chunks (blocking, run off the event loop)"""
+        file.file.seek(0)
+        with open(file_path, "wb") as f:
+            shutil.copyfileobj(file.file, f, length=1 << 20)
+    
+    async def _run_ethics_checks(self, job: Job, project: Project):
         """Run initial ethics checks"""
-        logger.info("Running ethics checks", job_id=str(job.id))
-        
-        project = job.project
+        logger.info("Running ethics checks")
         
         # Check consent requirements
         if project.require_consent:
@@ -195,115 +335,224 @@ class DubbingService:
             }]
         )
     
+    async def _extract_audio(self, video_path: str) -> str:
+        """Extract a 16 kHz mono WAV once for ASR and voice cloning.
+        
+        Cached next to the video and keyed by its mtime, so re-runs reuse it.
+        """
+        base_name, _ = os.path.splitext(video_path)
+        wav_path = f"{base_name}_audio_{os.stat(video_path).st_mtime_ns}.wav"
+        if os.path.exists(wav_path):
+            return wav_path
+        
+        partial_path = f"{wav_path}.part"
+        process = await asyncio.create_subprocess_exec(
+            "ffmpeg", "-y", "-i", video_path,
+            "-vn", "-ac", "1", "-ar", "16000", "-c:a", "pcm_s16le",
+            "-f", "wav", partial_path,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE
+        )
+        _, stderr = await process.communicate()
+        if process.returncode != 0:
+            if os.path.exists(partial_path):
+                os.remove(partial_path)
+            raise FileProcessingError(
+                f"Audio extraction failed: {stderr.decode(errors='replace')[-500:]}"
+            )
+        
+        os.replace(partial_path, wav_path)
+        return wav_path
+    
     async def _run_asr(self, job: Job) -> Dict[str, Any]:
         """Run Automatic Speech Recognition"""
-        logger.info("Running ASR", job_id=str(job.id))
+        logger.info("Running ASR")
         
-        video_path = job.input_data["video_path"]
+        audio_path = job.input_data["audio_path"]
         source_language = job.input_data.get("source_language")
         
-        # Call ASR service
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.ai_services_base_url}:8001/transcribe",
-                json={
-                    "audio_path": video_path,
-                    "language": source_language,
-                    "return_segments": True
-                },
-                timeout=300
-            )
-            response.raise_for_status()
-            return response.json()
-    
-    async def _run_translation(self, job: Job, transcript: Dict[str, Any]) -> Dict[str, Any]:
-        """Run translation for all target languages"""
-        logger.info("Running translation", job_id=str(job.id))
-        
-        source_language = transcript.get("language", "en")
-        target_languages = job.input_data["target_languages"]
-        source_text = transcript["text"]
-        
-        translations = {}
-        
-        for target_lang in target_languages:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    f"{self.ai_services_base_url}:8002/translate",
-                    json={
-                        "text": source_text,
-                        "source_language": source_language,
-                        "target_language": target_lang
-                    },
-                    timeout=120
-                )
-                response.raise_for_status()
-                translations[target_lang] = response.json()
+        # The extracted WAV is already 16 kHz mono s16le, so ASR can map its samples directly
+        pcm_offset, pcm_bytes = _wav_data_chunk(audio_path)
         
-        return translations
+        # Call ASR service
+        return await self._call_ai_service(
+            ":8001/transcribe",
+            {
+                "audio_path": audio_path,
+                "audio_pcm_offset": pcm_offset,
+                "audio_pcm_bytes": pcm_bytes,
+                "language": source_language,
+                "return_segments": True
+            },
+            timeout=300
+        )
     
-    async def _run_voice_synthesis(self, job: Job, translations: Dict[str, Any]) -> Dict[str, Any]:
-        """Run voice synthesis for all translations"""
-        logger.info("Running voice synthesis", job_id=str(job.id))
+    async def _enroll_speaker(self, job: Job) -> Optional[str]:
+        """Enroll the source speaker with TTS once for all target languages"""
+        if not job.input_data["settings"].get("enable_voice_cloning", True):
+            return None
         
-        settings_data = job.input_data["settings"]
-        enable_voice_cloning = settings_data.get("enable_voice_cloning", True)
+        # Retries keep the id the first run committed
+        if job.input_data.get("speaker_id"):
+            return None
         
-        audio_files = {}
+        logger.info("Enrolling speaker")
         
-        for lang, translation in translations.items():
-            request_data = {
-                "text": translation["translated_text"],
-                "language": lang,
-                "emotion": "neutral"
-            }
-            
-            if enable_voice_cloning:
-                # Use original video audio as reference
-                request_data["speaker_wav"] = job.input_data["video_path"]
+        result = await self._call_ai_service(
+            ":8003/enroll_speaker",
+            {"reference_audio": job.input_data["audio_path"]},
+            timeout=120
+        )
+        return result["speaker_id"]
+    
+    async def _run_language_stages(
+        self,
+        job: Job,
+        transcript: Dict[str, Any],
+        translations: Dict[str, Any],
+        on_step: Callable[[], Awaitable[None]]
+    ) -> Dict[str, Any]:
+        """Translate, synthesize and animate each language through bounded stage queues.
+        
+        Every stage runs several workers, so languages are processed concurrently
+        within a stage. Stages hand results on over queues of PIPELINE_PREFETCH items,
+        so a fast upstream stage blocks instead of flooding a slower AI service.
+        """
+        languages = job.input_data["target_languages"]
+        workers = max(1, min(settings.MAX_CONCURRENT_AI_CALLS, len(languages)))
+        
+        # One sentinel per worker ends each stage
+        language_queue: asyncio.Queue = asyncio.Queue()
+        for item in [(lang,) for lang in languages] + [None] * workers:
+            language_queue.put_nowait(item)
+        tts_queue: asyncio.Queue = asyncio.Queue(maxsize=settings.PIPELINE_PREFETCH)
+        animation_queue: asyncio.Queue = asyncio.Queue(maxsize=settings.PIPELINE_PREFETCH)
+        videos = {}
+        
+        async def translate(lang):
+            translation = translations.get(lang)
+            if translation is None:
+                translation = await self._run_translation(job, transcript, lang)
+                await on_step()
+            return lang, translation
+        
+        async def synthesize(lang, translation):
+            audio_data = await self._run_voice_synthesis(job, lang, translation)
+            await on_step()
+            return lang, audio_data
+        
+        async def animate(lang, audio_data):
+            videos[lang] = await self._run_face_animation(job, lang, audio_data)
+            await on_step()
+        
+        async def run_stage(work, inbox: asyncio.Queue, outbox: Optional[asyncio.Queue]):
+            async def worker():
+                while (item := await inbox.get()) is not None:
+                    result = await work(*item)
+                    if outbox is not None:
+                        await outbox.put(result)
             
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    f"{self.ai_services_base_url}:8003/synthesize",
-                    json=request_data,
-                    timeout=180
-                )
-                response.raise_for_status()
-                audio_files[lang] = response.json()
+            await asyncio.gather(*(worker() for _ in range(workers)))
+            if outbox is not None:
+                for _ in range(workers):
+                    await outbox.put(None)
+        
+        tasks = [
+            asyncio.create_task(run_stage(translate, language_queue, tts_queue)),
+            asyncio.create_task(run_stage(synthesize, tts_queue, animation_queue)),
+            asyncio.create_task(run_stage(animate, animation_queue, None)),
+        ]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            # A failed stage would leave its neighbours blocked on the queues
+            for task in tasks:
+                task.cancel()
+            raise
+        
+        # Workers finish out of order; keep the requested language order
+        return {lang: videos[lang] for lang in languages}
+    
+    async def _run_translation(self, job: Job, transcript: Dict[str, Any], lang: str) -> Dict[str, Any]:
+        """Run translation for one target language"""
+        logger.info("Running translation", language=lang)
+        
+        return await self._call_ai_service(
+            ":8002/translate",
+            {
+                "text": transcript["text"],
+                "source_language": transcript.get("language", "en"),
+                "target_language": lang
+            },
+            timeout=120
+        )
+    
+    async def _run_batch_translation(self, job: Job, transcript: Dict[str, Any]) -> Dict[str, Any]:
+        """Run translation for all target languages in one request"""
+        logger.info("Running batch translation")
+        
+        result = await self._call_ai_service(
+            ":8002/translate_multi",
+            {
+                "text": transcript["text"],
+                "source_language": transcript.get("language", "en"),
+                "target_languages": job.input_data["target_languages"]
+            },
+            timeout=300
+        )
+        return result["translations"]
+    
+    async def _run_voice_synthesis(self, job: Job, lang: str, translation: Dict[str, Any]) -> Dict[str, Any]:
+        """Run voice synthesis for one translation"""
+        logger.info("Running voice synthesis", language=lang)
         
-        return audio_files
+        settings_data = job.input_data["settings"]
+        request_data = {
+            "text": translation["translated_text"],
+            "language": lang,
+            "emotion": "neutral"
+        }
+        
+        if settings_data.get("enable_voice_cloning", True):
+            # Enrolled speaker; the reference clip covers a TTS restart
+            request_data["speaker_id"] = job.input_data.get("speaker_id")
+            request_data["speaker_wav"] = job.input_data["audio_path"]
+        
+        return await self._call_ai_service(":8003/synthesize", request_data, timeout=180)
     
-    async def _run_face_animation(self, job: Job, audio_files: Dict[str, Any]) -> Dict[str, Any]:
-        """Run face animation for all languages"""
-        logger.info("Running face animation", job_id=str(job.id))
+    async def _run_face_animation(self, job: Job, lang: str, audio_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Run face animation for one language"""
+        logger.info("Running face animation", language=lang)
         
-        video_path = job.input_data["video_path"]
         settings_data = job.input_data["settings"]
-        quality_mode = settings_data.get("quality_mode", "structural")
-        
-        animated_videos = {}
-        
-        for lang, audio_data in audio_files.items():
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    f"{self.ai_services_base_url}:8004/animate",
-                    json={
-                        "video_path": video_path,
-                        "audio_path": audio_data["audio_path"],
-                        "mode": quality_mode,
-                        "preserve_pose": True,
-                        "preserve_expression": settings_data.get("enable_emotion_preservation", True)
-                    },
-                    timeout=600
-                )
-                response.raise_for_status()
-                animated_videos[lang] = response.json()
         
-        return animated_videos
+        return await self._call_ai_service(
+            ":8004/animate",
+            {
+                "video_path": job.input_data["video_path"],
+                "audio_path": audio_data["audio_path"],
+                "mode": settings_data.get("quality_mode", "structural"),
+                "preserve_pose": True,
+                "preserve_expression": settings_data.get("enable_emotion_preservation", True)
+            },
+            timeout=600
+        )
+    
+    async def _call_ai_service(self, endpoint: str, payload: Dict[str, Any], timeout: float) -> Dict[str, Any]:
+        """POST to an AI service, bounded by the per-job concurrency limit"""
+        async with self._ai_call_limit:
+            response = await self._http.post(
+                f"{self.ai_services_base_url}{endpoint}",
+                content=orjson.dumps(payload),
+                headers=_JSON_HEADERS,
+                timeout=timeout
+            )
+        response.raise_for_status()
+        return response.json()
     
     async def _run_quality_checks(self, job: Job, videos: Dict[str, Any]) -> Dict[str, Any]:
         """Run quality checks on generated videos"""
-        logger.info("Running quality checks", job_id=str(job.id))
+        logger.info("Running quality checks")
         
         quality_results = {}
         
@@ -320,86 +569,81 @@ class DubbingService:
         
         return quality_results
     
-    async def _apply_ethical_safeguards(self, job: Job, videos: Dict[str, Any]) -> Dict[str, Any]:
+    async def _apply_ethical_safeguards(self, job: Job, project: Project, videos: Dict[str, Any]) -> Dict[str, Any]:
         """Apply watermarking and other ethical safeguards"""
-        logger.info("Applying ethical safeguards", job_id=str(job.id))
+        logger.info("Applying ethical safeguards")
         
-        project = job.project
         final_videos = {}
+        processing_steps = []
+        timestamp = datetime.utcnow().isoformat()
+        
+        # Apply watermarking if enabled, recording every language in one INSERT
+        if project.enable_watermarking:
+            watermarked_paths = await self.ethics_service.apply_watermarks_bulk([
+                {
+                    "project_id": str(project.id),
+                    "content_path": video_data["output_video_path"],
+                    "watermark_type": "invisible"
+                }
+                for video_data in videos.values()
+            ])
+            for video_data, watermarked_path in zip(videos.values(), watermarked_paths):
+                video_data["output_video_path"] = watermarked_path
         
         for lang, video_data in videos.items():
-            video_path = video_data["output_video_path"]
-            
-            # Apply watermarking if enabled
-            if project.enable_watermarking:
-                watermarked_path = await self.ethics_service.apply_watermark(
-                    project_id=project.id,
-                    content_path=video_path,
-                    watermark_type="invisible"
-                )
-                video_data["output_video_path"] = watermarked_path
-            
-            # Update provenance record
-            await self.ethics_service.update_provenance_record(
-                project_id=project.id,
-                processing_step={
-                    "step": "face_animation",
-                    "language": lang,
-                    "model": "DAE-Talker",
-                    "timestamp": datetime.utcnow().isoformat(),
-                    "quality_metrics": video_data.get("quality_metrics", {})
-                }
-            )
+            processing_steps.append({
+                "step": "face_animation",
+                "language": lang,
+                "model": "DAE-Talker",
+                "timestamp": timestamp,
+                "quality_metrics": video_data.get("quality_metrics", {})
+            })
             
             final_videos[lang] = video_data
         
+        # Update provenance record once for all languages
+        await self.ethics_service.update_provenance_record_bulk(
+            project_id=project.id,
+            processing_steps=processing_steps
+        )
+        
         return final_videos
     
     async def get_job_progress(self, job_id: str) -> DubbingProgressResponse:
         """Get detailed progress for a dubbing job"""
-        job = self.db.query(Job).filter(Job.id == job_id).first()
+        job = self._load_job(job_id)
         if not job:
             raise ValueError("Job not found")
         
-        # Define pipeline stages
-        stages = [
-            {"name": "Ethics Check", "progress": 1.0 if job.progress > 0.1 else 0.0},
-            {"name": "Speech Recognition", "progress": 1.0 if job.progress > 0.2 else 0.0},
-            {"name": "Translation", "progress": 1.0 if job.progress > 0.4 else 0.0},
-            {"name": "Voice Synthesis", "progress": 1.0 if job.progress > 0.6 else 0.0},
-            {"name": "Face Animation", "progress": 1.0 if job.progress > 0.8 else 0.0},
-            {"name": "Quality Check", "progress": 1.0 if job.progress >= 1.0 else 0.0},
-        ]
+        # Live progress while running; the database only has it at start and finish
+        progress = await self._progress_bus.get(str(job.id))
+        if progress is None or not job.is_active:
+            progress = job.progress or 0.0
         
-        # Determine current stage
-        current_stage = "Initializing"
-        for stage in stages:
-            if stage["progress"] < 1.0:
-                current_stage = stage["name"]
-                break
-        if job.progress >= 1.0:
-            current_stage = "Completed"
+        # Stages whose threshold progress has passed; the final stage completes at exactly 1.0
+        done = len(_STAGE_NAMES) if progress >= 1.0 else bisect.bisect_left(_STAGE_THRESHOLDS, progress)
+        current_stage, stages = _STAGE_TABLE[done]
         
         # Estimate remaining time
         estimated_time_remaining = None
-        if job.started_at and job.progress > 0:
+        if job.started_at and progress > 0:
             elapsed = (datetime.utcnow() - job.started_at).total_seconds()
-            if job.progress < 1.0:
-                estimated_total = elapsed / job.progress
+            if progress < 1.0:
+                estimated_total = elapsed / progress
                 estimated_time_remaining = int(estimated_total - elapsed)
         
         return DubbingProgressResponse(
             job_id=str(job.id),
-            overall_progress=job.progress,
+            overall_progress=progress,
             current_stage=current_stage,
-            stages=stages,
+            stages=list(stages),
             estimated_time_remaining=estimated_time_remaining,
             quality_metrics=job.quality_metrics
         )
     
     async def cancel_job(self, job_id: str):
         """Cancel a running job"""
-        job = self.db.query(Job).filter(Job.id == job_id).first()
+        job = self._load_job(job_id)
         if not job:
             raise ValueError("Job not found")
         
@@ -2,45 +2,124 @@
 Ethics service for consent management, watermarking, and provenance tracking
 """
 
+import asyncio
 import hashlib
-import json
 import os
+import shutil
 from datetime import datetime
 from typing import Dict, Any, Optional, List
+import blake3
+import orjson
 import structlog
 
+from sqlalchemy import bindparam, func, insert, select, true
 from sqlalchemy.orm import Session
 from app.models import ConsentRecord, WatermarkRecord, ProvenanceRecord, Project
 from app.core.config import get_settings
+from app.core.database import engine, no_expire_on_commit
+from app.services.hashing import file_sha256, file_sha256_many
 
 logger = structlog.get_logger()
 settings = get_settings()
 
+# Watermark detection key derived from the app secret; never stored
+_DETECTION_KEY = blake3.blake3(
+    settings.SECRET_KEY.encode(),
+    derive_key_context="ai-dubbing-platform watermark detection key v1"
+).digest()
+
+# File extension -> content type
+_EXT_TO_CONTENT_TYPE = {
+    **dict.fromkeys(('.mp4', '.avi', '.mov', '.mkv'), 'video'),
+    **dict.fromkeys(('.wav', '.mp3', '.aac', '.flac'), 'audio'),
+    **dict.fromkeys(('.jpg', '.jpeg', '.png', '.bmp'), 'image'),
+}
+
+
+def _build_dashboard_query():
+    """Project compliance flags plus consent, watermark and provenance aggregates"""
+    consents = select(
+        func.count().label("total"),
+        func.count().filter(ConsentRecord.is_active).label("active"),
+        func.array_agg(ConsentRecord.consent_type.distinct()).label("types")
+    ).where(ConsentRecord.project_id == Project.id).lateral("c")
+    
+    watermarks = select(
+        func.count().label("total"),
+        func.array_agg(WatermarkRecord.watermark_type.distinct()).label("types"),
+        func.avg(WatermarkRecord.watermark_strength).label("average_strength"),
+        func.sum(
+            func.coalesce(WatermarkRecord.psnr, 0) / 40 + func.coalesce(WatermarkRecord.ssim, 0)
+        ).label("quality_sum")
+    ).where(WatermarkRecord.project_id == Project.id).lateral("w")
+    
+    provenance = select(
+        func.count().label("total"),
+        func.count().filter(ProvenanceRecord.is_c2pa_compliant).label("c2pa_compliant"),
+        func.count().filter(ProvenanceRecord.human_review.is_(True)).label("human_reviewed")
+    ).where(ProvenanceRecord.project_id == Project.id).lateral("pr")
+    
+    return select(
+        Project.require_consent, Project.enable_watermarking, Project.enable_provenance,
+        consents.c.total, consents.c.active, consents.c.types,
+        watermarks.c.total, watermarks.c.types, watermarks.c.average_strength, watermarks.c.quality_sum,
+        provenance.c.total, provenance.c.c2pa_compliant, provenance.c.human_reviewed
+    ).select_from(Project).join(consents, true()).join(watermarks, true()).join(provenance, true()).where(
+        Project.id == bindparam("project_id")
+    )
+
+
+# Compiled once for the engine's DB-API paramstyle and run on a raw cursor
+_DASHBOARD_QUERY = _build_dashboard_query().compile(dialect=engine.dialect)
+
+# Rows per multi-row INSERT
+_INSERT_BATCH_SIZE = 1000
+
+
+def _canonical_json(obj: Any) -> bytes:
+    """Serialize to sorted-key JSON bytes for hashing"""
+    return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS | orjson.OPT_NAIVE_UTC)
+
+
+def _copy_file(src: str, dst: str):
+    """Copy a file inside the kernel (reflinked where supported), like shutil.copy2"""
+    try:
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            remaining = os.fstat(fsrc.fileno()).st_size
+            while remaining > 0:
+                copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), min(remaining, 1 << 30))
+                if copied == 0:
+                    break
+                remaining -= copied
+    except (AttributeError, OSError):
+        # No copy_file_range (non-Linux) or unsupported across these filesystems
+        shutil.copy2(src, dst)
+        return
+    shutil.copystat(src, dst)
+
 
 class EthicsService:
     """Service for ethical AI compliance"""
     
     def __init__(self, db: Session):
         self.db = db
+        self._watermark_strength = settings.WATERMARK_STRENGTH
     
     async def check_consent_status(self, project_id: str) -> Dict[str, Any]:
         """Check consent status for a project"""
         logger.info("Checking consent status", project_id=project_id)
         
-        consent_records = self.db.query(ConsentRecord).filter(
-            ConsentRecord.project_id == project_id,
-            ConsentRecord.is_granted == True
+        consent_types = self.db.scalars(
+            select(ConsentRecord.consent_type).where(
+                ConsentRecord.project_id == project_id,
+                ConsentRecord.is_active
+            )
         ).all()
         
-        active_consents = [
-            record for record in consent_records
-            if record.is_active
-        ]
-        
         return {
-            "has_consent": len(active_consents) > 0,
-            "consent_count": len(active_consents),
-            "consent_types": [record.consent_type for record in active_consents]
+            "has_consent": len(consent_types) > 0,
+            "consent_count": len(consent_types),
+            "consent_types": list(consent_types)
         }
     
     async def create_consent_record(
@@ -87,8 +166,8 @@ class EthicsService:
         document_path: Optional[str] = None
     ):
         """Grant consent for a consent record"""
-        consent_record = self.db.query(ConsentRecord).filter(
-            ConsentRecord.id == consent_id
+        consent_record = self.db.scalars(
+            select(ConsentRecord).where(ConsentRecord.id == consent_id)
         ).first()
         
         if not consent_record:
@@ -101,8 +180,8 @@ class EthicsService:
     
     async def revoke_consent(self, consent_id: str):
         """Revoke consent"""
-        consent_record = self.db.query(ConsentRecord).filter(
-            ConsentRecord.id == consent_id
+        consent_record = self.db.scalars(
+            select(ConsentRecord).where(ConsentRecord.id == consent_id)
         ).first()
         
         if not consent_record:
@@ -122,6 +201,58 @@ class EthicsService:
         strength: Optional[float] = None
     ) -> str:
         """Apply watermark to content"""
+        watermarked_paths = await self.apply_watermarks_bulk([{
+            "project_id": project_id,
+            "content_path": content_path,
+            "watermark_type": watermark_type,
+            "watermark_method": watermark_method,
+            "strength": strength
+        }])
+        return watermarked_paths[0]
+    
+    async def apply_watermarks_bulk(self, items: List[Dict[str, Any]]) -> List[str]:
+        """Apply watermarks to several files and record them with one INSERT per batch.
+        
+        Each item takes the apply_watermark keyword arguments; returns the
+        watermarked paths in item order.
+        """
+        for item in items:
+            if not os.path.exists(item["content_path"]):
+                raise FileNotFoundError(f"Content file not found: {item['content_path']}")
+        
+        # Hash every source up front so large files are digested concurrently
+        content_hashes = await file_sha256_many([item["content_path"] for item in items])
+        
+        rows = []
+        watermarked_paths = []
+        for item, content_hash in zip(items, content_hashes):
+            watermarked_path, row = await self._prepare_watermark(content_hash=content_hash, **item)
+            watermarked_paths.append(watermarked_path)
+            rows.append(row)
+        
+        insert_stmt = insert(WatermarkRecord).returning(WatermarkRecord.id)
+        for start in range(0, len(rows), _INSERT_BATCH_SIZE):
+            watermark_ids = self.db.scalars(
+                insert_stmt, rows[start:start + _INSERT_BATCH_SIZE]
+            ).all()
+            logger.info(
+                "Watermarks applied",
+                watermark_ids=[str(watermark_id) for watermark_id in watermark_ids]
+            )
+        self.db.commit()
+        
+        return watermarked_paths
+    
+    async def _prepare_watermark(
+        self,
+        project_id: str,
+        content_path: str,
+        content_hash: str,
+        watermark_type: str = "invisible",
+        watermark_method: str = "LSB",
+        strength: Optional[float] = None
+    ) -> tuple[str, Dict[str, Any]]:
+        """Watermark one file and build its record row"""
         logger.info(
             "Applying watermark",
             project_id=project_id,
@@ -129,56 +260,43 @@ class EthicsService:
             watermark_type=watermark_type
         )
         
-        if not os.path.exists(content_path):
-            raise FileNotFoundError(f"Content file not found: {content_path}")
+        now = datetime.utcnow()
+        resolved_strength = strength if strength is not None else self._watermark_strength
         
         # Generate watermark payload
         payload = {
             "project_id": project_id,
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": now.isoformat(),
             "platform": "Multilingual AI Dubbing Platform",
             "version": "1.0.0",
             "ai_generated": True
         }
         
-        # Calculate content hash
-        content_hash = await self._calculate_file_hash(content_path)
-        
         # Apply watermark (simplified implementation)
         watermarked_path = await self._apply_watermark_to_file(
             content_path,
             payload,
             watermark_type,
             watermark_method,
-            strength or settings.WATERMARK_STRENGTH
+            resolved_strength
         )
         
-        # Create watermark record
-        watermark_record = WatermarkRecord(
-            project_id=project_id,
-            watermark_type=watermark_type,
-            watermark_method=watermark_method,
-            watermark_strength=strength or settings.WATERMARK_STRENGTH,
-            content_type=self._get_content_type(content_path),
-            content_path=watermarked_path,
-            content_hash=content_hash,
-            payload_data=payload,
-            payload_hash=hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest(),
-            detection_key=self._generate_detection_key(payload),
-            is_detectable=True,
-            detection_confidence=0.95
-        )
-        
-        self.db.add(watermark_record)
-        self.db.commit()
-        
-        logger.info(
-            "Watermark applied",
-            watermark_id=str(watermark_record.id),
-            watermarked_path=watermarked_path
-        )
-        
-        return watermarked_path
+        # Watermark record row
+        payload_bytes = _canonical_json(payload)
+        return watermarked_path, {
+            "project_id": project_id,
+            "watermark_type": watermark_type,
+            "watermark_method": watermark_method,
+            "watermark_strength": resolved_strength,
+            "content_type": self._get_content_type(content_path),
+            "content_path": watermarked_path,
+            "content_hash": content_hash,
+            "payload_data": payload,
+            "payload_hash": blake3.blake3(payload_bytes).hexdigest(),
+            "detection_key": self._generate_detection_key(payload_bytes),
+            "is_detectable": True,
+            "detection_confidence": 0.95
+        }
     
     async def detect_watermark(self, content_path: str) -> Dict[str, Any]:
         """Detect watermark in content"""
@@ -212,6 +330,7 @@ class EthicsService:
             content_path=content_path
         )
         
+        now = datetime.utcnow()
         content_hash = await self._calculate_file_hash(content_path)
         
         # Create C2PA manifest (simplified)
@@ -228,7 +347,7 @@ class EthicsService:
                         "actions": [
                             {
                                 "action": "c2pa.ai_generative_training",
-                                "when": datetime.utcnow().isoformat(),
+                                "when": now.isoformat(),
                                 "softwareAgent": "Multilingual AI Dubbing Platform"
                             }
                         ]
@@ -237,7 +356,7 @@ class EthicsService:
             ],
             "signature_info": {
                 "issuer": "AI Dubbing Platform",
-                "time": datetime.utcnow().isoformat()
+                "time": now.isoformat()
             }
         }
         
@@ -248,15 +367,16 @@ class EthicsService:
             content_hash=content_hash,
             processing_chain=processing_chain,
             source_content_hash=source_content_hash,
-            generation_timestamp=datetime.utcnow(),
+            generation_timestamp=now,
             generation_parameters=generation_parameters or {},
             c2pa_manifest=c2pa_manifest,
             c2pa_signature=self._generate_c2pa_signature(c2pa_manifest)
         )
         
         self.db.add(provenance_record)
-        self.db.commit()
-        self.db.refresh(provenance_record)
+        # Every column value is set client-side, so no reload is needed after commit
+        with no_expire_on_commit(self.db):
+            self.db.commit()
         
         logger.info(
             "Provenance record created",
@@ -271,18 +391,28 @@ class EthicsService:
         processing_step: Dict[str, Any]
     ):
         """Update provenance record with new processing step"""
-        provenance_record = self.db.query(ProvenanceRecord).filter(
-            ProvenanceRecord.project_id == project_id
-        ).order_by(ProvenanceRecord.created_at.desc()).first()
+        await self.update_provenance_record_bulk(project_id, [processing_step])
+    
+    async def update_provenance_record_bulk(
+        self,
+        project_id: str,
+        processing_steps: List[Dict[str, Any]]
+    ):
+        """Update provenance record with several processing steps in one commit"""
+        provenance_record = self._lock_latest_provenance_record(project_id)
         
         if provenance_record:
-            provenance_record.add_processing_step(
-                step_name=processing_step["step"],
-                model_name=processing_step.get("model", "unknown"),
-                parameters=processing_step,
-                timestamp=datetime.fromisoformat(processing_step["timestamp"])
-            )
-            self.db.commit()
+            provenance_record.add_processing_steps([
+                (
+                    step["step"],
+                    step.get("model", "unknown"),
+                    step,
+                    datetime.fromisoformat(step["timestamp"])
+                )
+                for step in processing_steps
+            ])
+            with no_expire_on_commit(self.db):
+                self.db.commit()
     
     async def add_human_review(
         self,
@@ -291,23 +421,27 @@ class EthicsService:
         notes: Optional[str] = None
     ):
         """Add human review to provenance record"""
-        provenance_record = self.db.query(ProvenanceRecord).filter(
-            ProvenanceRecord.project_id == project_id
-        ).order_by(ProvenanceRecord.created_at.desc()).first()
+        provenance_record = self._lock_latest_provenance_record(project_id)
         
         if provenance_record:
             provenance_record.add_human_review(reviewer, notes)
-            self.db.commit()
+            with no_expire_on_commit(self.db):
+                self.db.commit()
+    
+    def _lock_latest_provenance_record(self, project_id: str) -> Optional[ProvenanceRecord]:
+        """Get the latest provenance record for a project, locked until commit"""
+        # The JSON chain is read-modified-written, so concurrent writers must serialize
+        return self.db.scalars(
+            select(ProvenanceRecord).where(
+                ProvenanceRecord.project_id == project_id
+            ).order_by(
+                ProvenanceRecord.created_at.desc()
+            ).limit(1).with_for_update(of=ProvenanceRecord)
+        ).first()
     
     async def _calculate_file_hash(self, file_path: str) -> str:
         """Calculate SHA-256 hash of file"""
-        hash_sha256 = hashlib.sha256()
-        
-        with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                hash_sha256.update(chunk)
-        
-        return hash_sha256.hexdigest()
+        return await file_sha256(file_path)
     
     async def _apply_watermark_to_file(
         self,
@@ -325,115 +459,116 @@ class EthicsService:
         watermarked_path = f"{base_name}_watermarked{ext}"
         
         # Copy file (in practice, apply actual watermarking)
-        import shutil
-        shutil.copy2(content_path, watermarked_path)
+        await asyncio.to_thread(_copy_file, content_path, watermarked_path)
         
         return watermarked_path
     
     def _get_content_type(self, file_path: str) -> str:
         """Determine content type from file extension"""
         ext = os.path.splitext(file_path)[1].lower()
-        
-        if ext in ['.mp4', '.avi', '.mov', '.mkv']:
-            return 'video'
-        elif ext in ['.wav', '.mp3', '.aac', '.flac']:
-            return 'audio'
-        elif ext in ['.jpg', '.jpeg', '.png', '.bmp']:
-            return 'image'
-        else:
-            return 'unknown'
+        return _EXT_TO_CONTENT_TYPE.get(ext, 'unknown')
     
-    def _generate_detection_key(self, payload: Dict[str, Any]) -> str:
-        """Generate detection key for watermark"""
-        payload_str = json.dumps(payload, sort_keys=True)
-        return hashlib.md5(payload_str.encode()).hexdigest()
+    def _generate_detection_key(self, payload_bytes: bytes) -> str:
+        """Generate detection key for watermark from its canonical payload"""
+        return blake3.blake3(payload_bytes, key=_DETECTION_KEY).hexdigest(length=16)
     
     def _generate_c2pa_signature(self, manifest: Dict[str, Any]) -> str:
         """Generate C2PA digital signature (simplified)"""
-        manifest_str = json.dumps(manifest, sort_keys=True)
-        return hashlib.sha256(manifest_str.encode()).hexdigest()
+        return hashlib.sha256(_canonical_json(manifest)).hexdigest()
     
     async def get_ethics_dashboard(self, project_id: str) -> Dict[str, Any]:
         """Get ethics dashboard data for a project"""
-        project = self.db.query(Project).filter(Project.id == project_id).first()
-        if not project:
+        # Blocking driver call, kept off the event loop
+        row = await asyncio.to_thread(self._fetch_dashboard_row, str(project_id))
+        if row is None:
             raise ValueError("Project not found")
         
-        # Get consent records
-        consent_records = self.db.query(ConsentRecord).filter(
-            ConsentRecord.project_id == project_id
-        ).all()
-        
-        # Get watermark records
-        watermark_records = self.db.query(WatermarkRecord).filter(
-            WatermarkRecord.project_id == project_id
-        ).all()
-        
-        # Get provenance records
-        provenance_records = self.db.query(ProvenanceRecord).filter(
-            ProvenanceRecord.project_id == project_id
-        ).all()
+        (
+            require_consent, enable_watermarking, enable_provenance,
+            consent_total, consent_active, consent_types,
+            watermark_total, watermark_types, average_strength, watermark_quality_sum,
+            provenance_total, c2pa_compliant, human_reviewed
+        ) = row
         
         return {
             "project_id": project_id,
             "consent_status": {
-                "total_records": len(consent_records),
-                "active_consents": len([r for r in consent_records if r.is_active]),
-                "consent_types": list(set([r.consent_type for r in consent_records]))
+                "total_records": consent_total,
+                "active_consents": consent_active,
+                "consent_types": consent_types or []
             },
             "watermarking_status": {
-                "total_watermarks": len(watermark_records),
-                "watermark_types": list(set([r.watermark_type for r in watermark_records])),
-                "average_strength": sum([r.watermark_strength for r in watermark_records]) / len(watermark_records) if watermark_records else 0
+                "total_watermarks": watermark_total,
+                "watermark_types": watermark_types or [],
+                "average_strength": average_strength or 0
             },
             "provenance_status": {
-                "total_records": len(provenance_records),
-                "c2pa_compliant": len([r for r in provenance_records if r.is_c2pa_compliant]),
-                "human_reviewed": len([r for r in provenance_records if r.human_review])
+                "total_records": provenance_total,
+                "c2pa_compliant": c2pa_compliant,
+                "human_reviewed": human_reviewed
             },
             "compliance_score": self._calculate_compliance_score(
-                consent_records, watermark_records, provenance_records, project
+                require_consent=require_consent,
+                enable_watermarking=enable_watermarking,
+                enable_provenance=enable_provenance,
+                active_consent_count=consent_active,
+                watermark_count=watermark_total,
+                watermark_quality_sum=watermark_quality_sum or 0.0,
+                provenance_count=provenance_total,
+                c2pa_compliant_count=c2pa_compliant,
+                human_review_count=human_reviewed
             )
         }
     
+    def _fetch_dashboard_row(self, project_id: str) -> Optional[tuple]:
+        """One aggregate round trip on the session's DB-API connection, skipping result wrapping"""
+        cursor = self.db.connection().connection.cursor()
+        try:
+            # construct_params evaluates per-call binds such as is_active's current time
+            cursor.execute(
+                _DASHBOARD_QUERY.string,
+                _DASHBOARD_QUERY.construct_params({"project_id": project_id})
+            )
+            return cursor.fetchone()
+        finally:
+            cursor.close()
+    
     def _calculate_compliance_score(
         self,
-        consent_records: List[ConsentRecord],
-        watermark_records: List[WatermarkRecord],
-        provenance_records: List[ProvenanceRecord],
-        project: Project
+        require_consent: bool,
+        enable_watermarking: bool,
+        enable_provenance: bool,
+        active_consent_count: int,
+        watermark_count: int,
+        watermark_quality_sum: float,
+        provenance_count: int,
+        c2pa_compliant_count: int,
+        human_review_count: int
     ) -> float:
-        """Calculate overall compliance score"""
+        """Calculate overall compliance score from precomputed counts"""
         score = 0.0
         max_score = 100.0
         
         # Consent compliance (30 points)
-        if project.require_consent:
-            active_consents = [r for r in consent_records if r.is_active]
-            if active_consents:
+        if require_consent:
+            if active_consent_count:
                 score += 30.0
         else:
             score += 30.0  # No consent required
         
         # Watermarking compliance (30 points)
-        if project.enable_watermarking:
-            if watermark_records:
-                avg_quality = sum([
-                    (r.psnr or 0) / 40 + (r.ssim or 0)  # Normalize quality metrics
-                    for r in watermark_records
-                ]) / len(watermark_records)
+        if enable_watermarking:
+            if watermark_count:
+                avg_quality = watermark_quality_sum / watermark_count
                 score += min(30.0, avg_quality * 30)
         else:
             score += 30.0  # No watermarking required
         
         # Provenance compliance (40 points)
-        if project.enable_provenance:
-            if provenance_records:
-                c2pa_compliant = len([r for r in provenance_records if r.is_c2pa_compliant])
-                human_reviewed = len([r for r in provenance_records if r.human_review])
-                
-                score += (c2pa_compliant / len(provenance_records)) * 20  # C2PA compliance
-                score += (human_reviewed / len(provenance_records)) * 20  # Human review
+        if enable_provenance:
+            if provenance_count:
+                score += (c2pa_compliant_count / provenance_count) * 20  # C2PA compliance
+                score += (human_review_count / provenance_count) * 20  # Human review
         else:
             score += 40.0  # No provenance required
         
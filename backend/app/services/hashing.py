@@ -0,0 +1,108 @@
+"""
+File content hashing with a persistent digest cache
+"""
+
+import asyncio
+import hashlib
+import json
+import mmap
+import os
+from collections import OrderedDict
+from typing import List, Optional
+import structlog
+
+from app.core.config import get_settings
+
+logger = structlog.get_logger()
+settings = get_settings()
+
+# Files above this size are memory-mapped for hashing
+_MMAP_HASH_THRESHOLD = 16 * 1024 * 1024
+
+# SHA-256 digests keyed by (path, mtime_ns, size), persisted across restarts
+_HASH_CACHE_SIZE = 1024
+_HASH_CACHE_PATH = os.path.join(settings.CACHE_DIR, "hash_cache.json")
+_hash_cache: Optional[OrderedDict] = None
+
+
+def _load_hash_cache() -> OrderedDict:
+    """Load persisted file digests, starting empty if none are usable"""
+    try:
+        with open(_HASH_CACHE_PATH) as f:
+            entries = json.load(f)
+        return OrderedDict(
+            ((path, mtime_ns, size), digest) for path, mtime_ns, size, digest in entries
+        )
+    except (OSError, ValueError, TypeError) as e:
+        if not isinstance(e, FileNotFoundError):
+            logger.warning("Ignoring unreadable hash cache", path=_HASH_CACHE_PATH, error=str(e))
+        return OrderedDict()
+
+
+def _save_hash_cache(entries: list):
+    """Persist file digests atomically"""
+    os.makedirs(settings.CACHE_DIR, exist_ok=True)
+    partial_path = f"{_HASH_CACHE_PATH}.{os.getpid()}.part"
+    with open(partial_path, "w") as f:
+        json.dump(entries, f)
+    os.replace(partial_path, _HASH_CACHE_PATH)
+
+
+def hash_file(file_path: str) -> str:
+    """Calculate SHA-256 hash of file (blocking)"""
+    with open(file_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size > _MMAP_HASH_THRESHOLD:
+            # Large media: hash the whole mapping in one update, with sequential readahead
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                if hasattr(mmap, "MADV_SEQUENTIAL"):
+                    mapped.madvise(mmap.MADV_SEQUENTIAL)
+                return hashlib.sha256(mapped).hexdigest()
+        
+        if hasattr(hashlib, "file_digest"):
+            # Python 3.11+: the read/update loop runs in C
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        
+        hash_sha256 = hashlib.sha256()
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            hash_sha256.update(chunk)
+        return hash_sha256.hexdigest()
+
+
+async def file_sha256(file_path: str) -> str:
+    """Calculate SHA-256 hash of file, reusing the digest while it is unchanged"""
+    digests = await file_sha256_many([file_path])
+    return digests[0]
+
+
+async def file_sha256_many(file_paths: List[str]) -> List[str]:
+    """Calculate SHA-256 hashes of several files, hashing uncached ones in parallel threads"""
+    global _hash_cache
+    if _hash_cache is None:
+        _hash_cache = _load_hash_cache()
+    
+    keys = []
+    for file_path in file_paths:
+        stat = os.stat(file_path)
+        keys.append((os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size))
+    
+    known = {key: _hash_cache[key] for key in keys if key in _hash_cache}
+    missing = [key for key in dict.fromkeys(keys) if key not in known]
+    
+    # hashlib releases the GIL while digesting, so distinct files hash on separate cores
+    computed = await asyncio.gather(*(asyncio.to_thread(hash_file, key[0]) for key in missing))
+    known.update(zip(missing, computed))
+    
+    for key in keys:
+        _hash_cache[key] = known[key]
+        _hash_cache.move_to_end(key)
+    
+    if missing:
+        while len(_hash_cache) > _HASH_CACHE_SIZE:
+            _hash_cache.popitem(last=False)
+        
+        entries = [[*key, value] for key, value in _hash_cache.items()]
+        try:
+            await asyncio.to_thread(_save_hash_cache, entries)
+        except OSError as e:
+            logger.warning("Failed to persist hash cache", error=str(e))
+    return [known[key] for key in keys]
\ No newline at end of file
@@ -0,0 +1,70 @@
+"""
+Live job progress published over Redis instead of per-stage database commits
+"""
+
+from typing import Optional
+import redis.asyncio as redis
+from redis.exceptions import RedisError
+import structlog
+
+from app.core.config import get_settings
+
+logger = structlog.get_logger()
+settings = get_settings()
+
+
+class ProgressBus:
+    """Publishes job progress and keeps the last value for readers"""
+    
+    def __init__(self, client: redis.Redis):
+        self.client = client
+    
+    @staticmethod
+    def _key(job_id: str) -> str:
+        return f"job:{job_id}:progress"
+    
+    async def publish(self, job_id: str, progress: float):
+        """Store and broadcast the latest progress for a job"""
+        try:
+            async with self.client.pipeline(transaction=False) as pipe:
+                pipe.set(self._key(job_id), progress, ex=settings.JOB_TIMEOUT)
+                pipe.publish(f"job:{job_id}", progress)
+                await pipe.execute()
+        except RedisError as e:
+            # Progress is advisory; the database still gets the final state
+            logger.warning("Failed to publish job progress", job_id=job_id, error=str(e))
+    
+    async def clear(self, job_id: str):
+        """Forget the last published progress, e.g. from a failed run"""
+        try:
+            await self.client.delete(self._key(job_id))
+        except RedisError as e:
+            logger.warning("Failed to clear job progress", job_id=job_id, error=str(e))
+    
+    async def get(self, job_id: str) -> Optional[float]:
+        """Get last published progress, or None if unknown"""
+        try:
+            value = await self.client.get(self._key(job_id))
+        except RedisError as e:
+            logger.warning("Failed to read job progress", job_id=job_id, error=str(e))
+            return None
+        return float(value) if value is not None else None
+
+
+_progress_bus: Optional[ProgressBus] = None
+
+
+def get_progress_bus() -> ProgressBus:
+    """Get the shared progress bus"""
+    global _progress_bus
+    if _progress_bus is None:
+        _progress_bus = ProgressBus(redis.from_url(settings.REDIS_URL))
+    return _progress_bus
+
+
+async def close_progress_bus():
+    """Close the shared progress bus"""
+    global _progress_bus
+    if _progress_bus is not None:
+        await _progress_bus.client.aclose()
+        _progress_bus = None
@@ -0,0 +1,65 @@
+"""
+Celery worker that runs dubbing pipelines outside the API process
+"""
+
+import asyncio
+
+from celery import Celery
+from celery.schedules import crontab
+import structlog
+
+from app.core.config import get_settings
+from app.core.database import SessionLocal, engine, ensure_monthly_partitions
+from app.core.logging import configure_logging
+from app.services.dubbing import DubbingService, close_http_client
+from app.services.progress import close_progress_bus
+
+configure_logging()
+logger = structlog.get_logger()
+settings = get_settings()
+
+celery_app = Celery(
+    "dubbing",
+    broker=settings.CELERY_BROKER_URL,
+    backend=settings.CELERY_RESULT_BACKEND
+)
+celery_app.conf.update(
+    task_serializer="json",
+    accept_content=["json"],
+    # A job is acknowledged only once it finishes, and each worker takes one at a time
+    task_acks_late=True,
+    worker_prefetch_multiplier=1,
+    worker_concurrency=settings.MAX_CONCURRENT_JOBS,
+    task_time_limit=settings.JOB_TIMEOUT,
+    beat_schedule={
+        "ensure-monthly-partitions": {
+            "task": "maintenance.ensure_partitions",
+            "schedule": crontab(hour=3, minute=0),
+        },
+    },
+)
+
+
+@celery_app.task(name="maintenance.ensure_partitions")
+def ensure_partitions():
+    """Keep created_at partitions ahead of inserts"""
+    if engine.dialect.name == "postgresql":
+        ensure_monthly_partitions()
+
+
+@celery_app.task(name="dubbing.process_job", bind=True)
+def process_dubbing_job(self, job_id: str):
+    """Run the dubbing pipeline for a job"""
+    asyncio.run(_process_dubbing_job(job_id, self.request.hostname, self.request.id))
+
+
+async def _process_dubbing_job(job_id: str, worker_id: str, task_id: str):
+    """Process a job with its own session and event-loop-bound clients"""
+    db = SessionLocal()
+    try:
+        await DubbingService(db).process_dubbing_job(job_id, worker_id=worker_id, task_id=task_id)
+    finally:
+        # Shared clients are bound to this task's event loop
+        await close_http_client()
+        await close_progress_bus()
+        db.close()
\ No newline at end of file
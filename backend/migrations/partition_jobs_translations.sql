@@ -0,0 +1,165 @@
+-- Upgrade a database created before jobs and translations were partitioned.
+--
+-- create_all only creates missing tables, so existing databases need this
+-- script once, with the API and workers stopped:
+--
+--   psql "$DATABASE_URL" -v ON_ERROR_STOP=1 -f backend/migrations/partition_jobs_translations.sql
+--
+-- It adds the columns and indexes introduced alongside partitioning, then
+-- rebuilds jobs and translations as created_at range-partitioned tables with
+-- one partition per UTC month of existing data, plus the current month and
+-- the next two. The application keeps later months created from then on.
+
+BEGIN;
+
+-- Generated HH:MM:SS durations
+ALTER TABLE media_files ADD COLUMN IF NOT EXISTS duration_hms varchar(16)
+    GENERATED ALWAYS AS (
+        lpad((floor(coalesce(duration, 0))::bigint / 3600)::text, greatest(length((floor(coalesce(duration, 0))::bigint / 3600)::text), 2), '0') || ':' || lpad((floor(coalesce(duration, 0))::bigint % 3600 / 60)::text, 2, '0') || ':' || lpad((floor(coalesce(duration, 0))::bigint % 60)::text, 2, '0')
+    ) STORED;
+ALTER TABLE voice_clones ADD COLUMN IF NOT EXISTS training_duration_hms varchar(16)
+    GENERATED ALWAYS AS (
+        lpad((floor(coalesce(training_duration, 0))::bigint / 3600)::text, greatest(length((floor(coalesce(training_duration, 0))::bigint / 3600)::text), 2), '0') || ':' || lpad((floor(coalesce(training_duration, 0))::bigint % 3600 / 60)::text, 2, '0') || ':' || lpad((floor(coalesce(training_duration, 0))::bigint % 60)::text, 2, '0')
+    ) STORED;
+
+-- Packed media flags
+ALTER TABLE media_files ADD COLUMN IF NOT EXISTS media_flags smallint
+    GENERATED ALWAYS AS (
+        (CASE WHEN height >= 720 THEN 1 ELSE 0 END | CASE WHEN height >= 2160 THEN 2 ELSE 0 END | CASE media_type WHEN 'VIDEO' THEN 4 WHEN 'AUDIO' THEN 8 WHEN 'IMAGE' THEN 16 ELSE 0 END)::smallint
+    ) STORED;
+CREATE INDEX IF NOT EXISTS ix_media_files_4k ON media_files (media_flags) WHERE media_flags & 2 = 2;
+
+-- TIMESTAMPTZ created_at with BRIN indexes (stored values are UTC)
+ALTER TABLE projects
+    ALTER COLUMN created_at TYPE timestamptz USING created_at AT TIME ZONE 'UTC',
+    ALTER COLUMN created_at SET DEFAULT now();
+ALTER TABLE media_files
+    ALTER COLUMN created_at TYPE timestamptz USING created_at AT TIME ZONE 'UTC',
+    ALTER COLUMN created_at SET DEFAULT now();
+CREATE INDEX IF NOT EXISTS ix_projects_created_brin ON projects USING brin (created_at) WITH (pages_per_range = 32);
+CREATE INDEX IF NOT EXISTS ix_media_files_created_brin ON media_files USING brin (created_at) WITH (pages_per_range = 32);
+
+-- JSONB user preferences
+ALTER TABLE users ALTER COLUMN preferred_languages TYPE jsonb
+    USING COALESCE(preferred_languages::jsonb, '[]'::jsonb);
+ALTER TABLE users ALTER COLUMN preferred_languages SET DEFAULT '[]'::jsonb;
+ALTER TABLE users ALTER COLUMN notification_preferences TYPE jsonb
+    USING COALESCE(notification_preferences::jsonb, '{}'::jsonb);
+ALTER TABLE users ALTER COLUMN notification_preferences SET DEFAULT '{}'::jsonb;
+
+-- Latest provenance record per project
+CREATE INDEX IF NOT EXISTS ix_provenance_records_project_created
+    ON provenance_records (project_id, created_at DESC);
+
+-- Project progress maintained from jobs; the counters are rebuilt by the
+-- jobs trigger as rows are copied below
+ALTER TABLE projects
+    ADD COLUMN IF NOT EXISTS progress_sum double precision NOT NULL DEFAULT 0,
+    ADD COLUMN IF NOT EXISTS job_count integer NOT NULL DEFAULT 0;
+UPDATE projects SET progress_sum = 0, job_count = 0, progress = 0;
+
+CREATE OR REPLACE FUNCTION project_progress_delta() RETURNS trigger AS $$
+DECLARE
+    delta_sum double precision;
+    delta_count integer;
+    target_id uuid;
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        delta_sum := COALESCE(NEW.progress, 0);
+        delta_count := 1;
+        target_id := NEW.project_id;
+    ELSIF TG_OP = 'DELETE' THEN
+        delta_sum := -COALESCE(OLD.progress, 0);
+        delta_count := -1;
+        target_id := OLD.project_id;
+    ELSE
+        delta_sum := COALESCE(NEW.progress, 0) - COALESCE(OLD.progress, 0);
+        delta_count := 0;
+        target_id := NEW.project_id;
+    END IF;
+
+    UPDATE projects
+       SET progress_sum = progress_sum + delta_sum,
+           job_count = job_count + delta_count,
+           progress = CASE WHEN job_count + delta_count > 0
+                           THEN (progress_sum + delta_sum) / (job_count + delta_count)
+                           ELSE 0 END
+     WHERE id = target_id;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Creates one partition per UTC month from the oldest row through two months ahead
+CREATE FUNCTION pg_temp.create_month_partitions(parent text, source regclass) RETURNS void AS $$
+DECLARE
+    month_start date;
+    last_month date := (date_trunc('month', now() AT TIME ZONE 'UTC') + interval '2 months')::date;
+BEGIN
+    EXECUTE format('SELECT date_trunc(''month'', min(created_at) AT TIME ZONE ''UTC'')::date FROM %s', source)
+        INTO month_start;
+    month_start := LEAST(COALESCE(month_start, last_month), (date_trunc('month', now() AT TIME ZONE 'UTC'))::date);
+    WHILE month_start <= last_month LOOP
+        EXECUTE format(
+            'CREATE TABLE %I PARTITION OF %I FOR VALUES FROM (%L) TO (%L)',
+            parent || '_' || to_char(month_start, 'YYYY_MM'),
+            parent,
+            month_start::text || ' 00:00:00+00',
+            (month_start + interval '1 month')::date::text || ' 00:00:00+00'
+        );
+        month_start := (month_start + interval '1 month')::date;
+    END LOOP;
+END;
+$$ LANGUAGE plpgsql;
+
+-- jobs: partitioned by created_at month, versioned rows
+ALTER TABLE jobs RENAME TO jobs_unpartitioned;
+ALTER TABLE jobs_unpartitioned RENAME CONSTRAINT jobs_pkey TO jobs_unpartitioned_pkey;
+DROP INDEX IF EXISTS ix_jobs_created_brin;
+ALTER TABLE jobs_unpartitioned
+    ALTER COLUMN created_at TYPE timestamptz USING created_at AT TIME ZONE 'UTC',
+    ALTER COLUMN created_at SET DEFAULT now(),
+    ADD COLUMN IF NOT EXISTS version integer NOT NULL DEFAULT 0;
+
+CREATE TABLE jobs (LIKE jobs_unpartitioned INCLUDING DEFAULTS INCLUDING CONSTRAINTS)
+    PARTITION BY RANGE (created_at);
+ALTER TABLE jobs
+    ADD CONSTRAINT jobs_pkey PRIMARY KEY (id, created_at),
+    ADD CONSTRAINT jobs_user_id_fkey FOREIGN KEY (user_id) REFERENCES users (id),
+    ADD CONSTRAINT jobs_project_id_fkey FOREIGN KEY (project_id) REFERENCES projects (id);
+CREATE INDEX ix_jobs_created_brin ON jobs USING brin (created_at) WITH (pages_per_range = 32);
+SELECT pg_temp.create_month_partitions('jobs', 'jobs_unpartitioned');
+
+CREATE TRIGGER jobs_progress_count
+AFTER INSERT OR DELETE ON jobs
+FOR EACH ROW EXECUTE FUNCTION project_progress_delta();
+
+CREATE TRIGGER jobs_progress_agg
+AFTER UPDATE OF progress ON jobs
+FOR EACH ROW WHEN (OLD.progress IS DISTINCT FROM NEW.progress)
+EXECUTE FUNCTION project_progress_delta();
+
+INSERT INTO jobs SELECT * FROM jobs_unpartitioned;
+DROP TABLE jobs_unpartitioned;
+
+-- translations: partitioned by created_at month, versioned rows
+ALTER TABLE translations RENAME TO translations_unpartitioned;
+ALTER TABLE translations_unpartitioned RENAME CONSTRAINT translations_pkey TO translations_unpartitioned_pkey;
+DROP INDEX IF EXISTS ix_translations_created_brin;
+ALTER TABLE translations_unpartitioned
+    ALTER COLUMN created_at TYPE timestamptz USING created_at AT TIME ZONE 'UTC',
+    ALTER COLUMN created_at SET DEFAULT now(),
+    ADD COLUMN IF NOT EXISTS version integer NOT NULL DEFAULT 0;
+
+CREATE TABLE translations (LIKE translations_unpartitioned INCLUDING DEFAULTS INCLUDING CONSTRAINTS)
+    PARTITION BY RANGE (created_at);
+ALTER TABLE translations
+    ADD CONSTRAINT translations_pkey PRIMARY KEY (id, created_at),
+    ADD CONSTRAINT translations_project_id_fkey FOREIGN KEY (project_id) REFERENCES projects (id),
+    ADD CONSTRAINT translations_reviewer_id_fkey FOREIGN KEY (reviewer_id) REFERENCES users (id);
+CREATE INDEX ix_translations_created_brin ON translations USING brin (created_at) WITH (pages_per_range = 32);
+SELECT pg_temp.create_month_partitions('translations', 'translations_unpartitioned');
+
+INSERT INTO translations SELECT * FROM translations_unpartitioned;
+DROP TABLE translations_unpartitioned;
+
+COMMIT;
\ No newline at end of file